@@ -113,6 +113,7 @@ CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])  # noqa: C408
 
 LIB_KEYS = tuple(SCH_GLOBAL_CONFIG({}).keys()) + (SZ_SERIAL_PORT,)
 LIB_CFG_KEYS = tuple(SCH_GLOBAL_CONFIG({})[SZ_CONFIG].keys()) + (SZ_EVOFW_FLAG,)
+ALL_LIB_KEYS = frozenset(LIB_KEYS + LIB_CFG_KEYS)
 
 
 def normalise_config(lib_config: dict) -> tuple[str, dict]:
@@ -127,9 +128,7 @@ def split_kwargs(obj: tuple[dict, dict], kwargs: dict) -> tuple[dict, dict]:
     """Split kwargs into cli/library kwargs."""
     cli_kwargs, lib_kwargs = obj
 
-    cli_kwargs.update(
-        {k: v for k, v in kwargs.items() if k not in LIB_KEYS + LIB_CFG_KEYS}
-    )
+    cli_kwargs.update({k: v for k, v in kwargs.items() if k not in ALL_LIB_KEYS})
     lib_kwargs.update({k: v for k, v in kwargs.items() if k in LIB_KEYS})
     lib_kwargs[SZ_CONFIG].update({k: v for k, v in kwargs.items() if k in LIB_CFG_KEYS})
 
@@ -487,7 +486,7 @@ async def main(command: str, lib_kwargs: dict, **kwargs):
             dtm = msg.dtm.isoformat(timespec="microseconds")
             con_cols = None
         else:
-            dtm = f"{msg.dtm:%H:%M:%S.%f}"[:-3]
+            dtm = msg.dtm.time().isoformat(timespec="milliseconds")  # HH:MM:SS.sss
             con_cols = CONSOLE_COLS
 
         if msg.src and msg.src.type == DEV_TYPE_MAP.HGI:
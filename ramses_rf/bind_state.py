@@ -96,6 +96,7 @@ class Context:
             raise BindStateError(f"{self}: Incompatible inital state: {initial_state}")
 
         self._is_respondent = initial_state is Listening
+        self._state_changed = asyncio.Event()  # for awaiting a change of State
         self._set_context_state(initial_state)
 
     def __repr__(self) -> str:
@@ -107,6 +108,8 @@ class Context:
     def _set_context_state(self, state: type[_State]) -> None:
         """Change the State of the Context."""
         self._state = state(self)
+        self._state_changed.set()  # wakes any current waiters...
+        self._state_changed.clear()  # ...but not any later ones
 
     @classmethod
     def respondent(cls, dev: _Faked) -> Context:  # HACK: using _context is regrettable
@@ -219,7 +222,9 @@ class State:
         self._set_context_state: Callable = context._set_context_state  # HACK
         self._prev_state: _State | None = self._context.state
 
-        _LOGGER.debug(f"{self}: Changing state from: {self._context.state} to: {self}")
+        _LOGGER.debug(
+            "%s: Changing state from: %s to: %s", self, self._context.state, self
+        )
 
         if self._has_wait_timer:
             self._timer_handle = asyncio.get_running_loop().call_later(
@@ -509,7 +514,9 @@ if TYPE_CHECKING:
 
 
 # Invalid states from which to move to a new an initial state (Listening, Offering)
-_BAD_PREV_STATES = (Listening, Offering, Offered, Accepting, Accepted, Confirming)
+_BAD_PREV_STATES = frozenset(
+    (Listening, Offering, Offered, Accepting, Accepted, Confirming)
+)
 
 
 class BindState:
@@ -524,6 +531,21 @@ class BindState:
     BOUND = Bound  # #         rcvd confirm,                bound
     BOUND_ACCEPTED = BoundAccepted
 
+    _ALL_STATES = frozenset(
+        (
+            UNKNOWN,
+            LISTENING,
+            OFFERING,
+            OFFERED,
+            ACCEPTING,
+            ACCEPTED,
+            CONFIRMING,
+            CONFIRMED,
+            BOUND,
+            BOUND_ACCEPTED,
+        )
+    )
+
     # SUPPLICANT/REQUEST -> RESPONDENT/WAITING
     #       DHW/THM, TRV -> CTL     (temp, valve_position), or:
     #                CTL -> BDR/OTB (heat_demand)
@@ -288,14 +288,14 @@ class RelayDemand(Fakeable, DeviceHeat):  # 0008
 
             cmd = Command.put_actuator_state(self.id, mod_level)
             qos = {SZ_PRIORITY: Priority.HIGH, SZ_RETRIES: 3}
-            [self._send_cmd(cmd, **qos) for _ in range(1)]  # type: ignore[func-returns-value]
+            self._send_cmd(cmd, **qos)
 
         elif msg.code == Code._3EF1 and msg.verb == RQ:  # NOTE: WIP for FAKING
             mod_level = 1.0
 
             cmd = Command.put_actuator_cycle(self.id, msg.src.id, mod_level, 600, 600)
             qos = {SZ_PRIORITY: Priority.HIGH, SZ_RETRIES: 3}
-            [self._send_cmd(cmd, **qos) for _ in range(1)]  # type: ignore[func-returns-value]
+            self._send_cmd(cmd, **qos)
 
     def _bind(self):
         # .I --- 01:054173 --:------ 01:054173 1FC9 018 03-0008-04D39D FC-3B00-04D39D 03-1FC9-04D39D
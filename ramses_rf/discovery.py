@@ -388,7 +388,8 @@ async def script_scan_otb_ramses(gwy, dev_id: str):  # Tested only upon a R8820A
     #  - ch setpoint          /
     #  - max. rel. modulation /
 
-    [gwy.send_cmd(_mk_cmd(RQ, c, "00", dev_id, qos=QOS_SCAN)) for c in CODES]
+    for c in CODES:
+        gwy.send_cmd(_mk_cmd(RQ, c, "00", dev_id, qos=QOS_SCAN))
 
 
 SCRIPTS = {
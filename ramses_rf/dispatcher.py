@@ -56,6 +56,16 @@ if DEV_MODE:
 
 STRICT_MODE = not DEV_MODE and False
 
+# these trade memory for speed
+_ARRAY_FRAGMENT_CODES = (Code._000A, Code._22C9)  # arrays that can span 2 pkts
+_TD_SECONDS_003 = td(seconds=3)
+
+_VERB_FLIP = {RQ: RP, RP: RQ, W_: I_}  # for _check_msg_dst(), NB: no I_
+
+_SLUGS_NOT_CHECKED = frozenset(  # TODO: use DEV_TYPE_MAP.PROMOTABLE_SLUGS
+    (DEV_TYPE.HGI, DEV_TYPE.DEV, DEV_TYPE.HEA, DEV_TYPE.HVC)
+)
+
 
 def _create_devices_from_addrs(gwy: Gateway, this: Message) -> None:
     """Discover and create any new devices using the packet addresses (not payload)."""
@@ -130,10 +140,10 @@ def _check_msg_src(msg: Message, *, slug: str = None) -> None:
 
     if slug is None:  # slug = best_dev_role(msg.src, msg=msg)._SLUG
         slug = getattr(msg.src, "_SLUG", DEV_TYPE.DEV)
-    if slug in (DEV_TYPE.HGI, DEV_TYPE.DEV, DEV_TYPE.HEA, DEV_TYPE.HVC):
-        return  # TODO: use DEV_TYPE_MAP.PROMOTABLE_SLUGS
+    if slug in _SLUGS_NOT_CHECKED:
+        return
 
-    if slug not in CODES_BY_DEV_SLUG:
+    if (codes := CODES_BY_DEV_SLUG.get(slug)) is None:
         if msg.code != Code._10E0 and msg.code not in CODES_OF_HVAC_DOMAIN_ONLY:
             err_msg = f"Unknown src type: {msg.dst}"
             if STRICT_MODE:
@@ -146,7 +156,7 @@ def _check_msg_src(msg: Message, *, slug: str = None) -> None:
     #
     #
 
-    if msg.code not in CODES_BY_DEV_SLUG[slug]:  # type: ignore[index]
+    if msg.code not in codes:
         if slug != DEV_TYPE.DEV:
             err_msg = f"Invalid code for {msg.src} to Tx: {msg.code}"
             if STRICT_MODE:
@@ -165,7 +175,7 @@ def _check_msg_src(msg: Message, *, slug: str = None) -> None:
 
     #
     # (code := CODES_BY_DEV_SLUG[slug][msg.code]) and msg.verb not in code:
-    if msg.verb not in CODES_BY_DEV_SLUG[slug][msg.code]:  # type: ignore[index]
+    if msg.verb not in codes[msg.code]:
         err_msg = f"Invalid verb/code for {msg.src} to Tx: {msg.verb}/{msg.code}"
         if STRICT_MODE:
             raise InvalidPacketError(err_msg)
@@ -180,10 +190,10 @@ def _check_msg_dst(msg: Message, *, slug: str = None) -> None:
 
     if slug is None:
         slug = getattr(msg.dst, "_SLUG", None)
-    if slug in (None, DEV_TYPE.HGI, DEV_TYPE.DEV, DEV_TYPE.HEA, DEV_TYPE.HVC):
-        return  # TODO: use DEV_TYPE_MAP.PROMOTABLE_SLUGS
+    if slug is None or slug in _SLUGS_NOT_CHECKED:
+        return
 
-    if slug not in CODES_BY_DEV_SLUG:
+    if (codes := CODES_BY_DEV_SLUG.get(slug)) is None:
         if msg.code not in CODES_OF_HVAC_DOMAIN_ONLY:
             err_msg = f"Unknown dst type: {msg.dst}"
             if STRICT_MODE:
@@ -195,10 +205,10 @@ def _check_msg_dst(msg: Message, *, slug: str = None) -> None:
 
     if msg.verb == I_:  # TODO: not common, unless src=dst
         return  # receiving an I isn't currently in the schema & cant yet be tested
-    if f"{slug}/{msg.verb}/{msg.code}" in (f"CTL/{RQ}/{Code._3EF1}",):
+    if (slug, msg.verb, msg.code) == (DEV_TYPE.CTL, RQ, Code._3EF1):
         return  # HACK: an exception-to-the-rule that need sorting
 
-    if msg.code not in CODES_BY_DEV_SLUG[slug]:  # type: ignore[index]
+    if msg.code not in codes:
         if False and slug != DEV_TYPE.HGI:  # NOTE: not yet needed because of 1st if
             err_msg = f"Invalid code for {msg.dst} to Rx: {msg.code}"
             if STRICT_MODE:
@@ -212,14 +222,14 @@ def _check_msg_dst(msg: Message, *, slug: str = None) -> None:
         )
         return
 
-    if f"{msg.verb}/{msg.code}" in (f"{W_}/{Code._0001}",):
+    if msg.verb == W_ and msg.code == Code._0001:
         return  # HACK: an exception-to-the-rule that need sorting
-    if f"{slug}/{msg.verb}/{msg.code}" in (f"{DEV_TYPE.BDR}/{RQ}/{Code._3EF0}",):
+    if (slug, msg.verb, msg.code) == (DEV_TYPE.BDR, RQ, Code._3EF0):
         return  # HACK: an exception-to-the-rule that need sorting
 
-    verb = {RQ: RP, RP: RQ, W_: I_}[msg.verb]
+    verb = _VERB_FLIP[msg.verb]
     # (code := CODES_BY_DEV_SLUG[klass][msg.code]) and verb not in code:
-    if verb not in CODES_BY_DEV_SLUG[slug][msg.code]:  # type: ignore[index]
+    if verb not in codes[msg.code]:
         err_msg = f"Invalid verb/code for {msg.dst} to Rx: {msg.verb}/{msg.code}"
         if STRICT_MODE:
             raise InvalidPacketError(err_msg)
@@ -238,19 +248,20 @@ def process_msg(msg: Message) -> None:
         # .I --- 01:158182 --:------ 01:158182 000A 048 001201F409C4011101F409C40...
         # .I --- 01:158182 --:------ 01:158182 000A 006 081001F409C4
         if (
-            not prev
+            this.code not in _ARRAY_FRAGMENT_CODES  # most likely, so test this 1st
+            or not prev
             or not prev._has_array
-            or this.code not in (Code._000A, Code._22C9)
             or this.code != prev.code
             or this.verb != prev.verb != I_
             or this.src != prev.src
-            or this.dtm >= prev.dtm + td(seconds=3)
+            or this.dtm >= prev.dtm + _TD_SECONDS_003
         ):
             return this.payload
 
         this._pkt._force_has_array()
-        payload = this.payload if isinstance(this.payload, list) else [this.payload]
-        return prev.payload + payload
+        if isinstance(this.payload, list):
+            return prev.payload + this.payload
+        return [*prev.payload, this.payload]  # avoids an interim single-item list
 
     # HACK: This is an unpleaseant anachronism
     gwy: Gateway = msg._gwy  # pylint: disable=protected-access, skipcq: PYL-W0212
@@ -260,20 +271,21 @@ def process_msg(msg: Message) -> None:
     )  # pylint: disable=protected-access, skipcq: PYL-W0212
 
     # HACK:  if CLI, double-logging with client.py proc_msg() & setLevel(DEBUG)
-    if (log_level := _LOGGER.getEffectiveLevel()) < logging.INFO:
-        _LOGGER.info(msg)
-    elif log_level <= logging.INFO and not (
-        msg.verb == RQ and msg.src.type == DEV_TYPE_MAP.HGI
+    if _LOGGER.isEnabledFor(logging.INFO) and (  # is cached, so cheap if not
+        _LOGGER.getEffectiveLevel() < logging.INFO
+        or not (msg.verb == RQ and msg.src.type == DEV_TYPE_MAP.HGI)
     ):
         _LOGGER.info(msg)
 
     msg._payload = detect_array_fragment(msg, gwy._prev_msg)  # HACK: needs rethinking?
 
+    reduce_processing = gwy.config.reduce_processing
+
     try:  # validate / dispatch the packet
         _check_msg_addrs(msg)  # ? InvalidAddrSetError
 
         # TODO: any use in creating a device only if the payload is valid?
-        if gwy.config.reduce_processing < DONT_CREATE_ENTITIES:
+        if reduce_processing < DONT_CREATE_ENTITIES:
             try:
                 _create_devices_from_addrs(gwy, msg)
             except LookupError as exc:
@@ -286,7 +298,7 @@ def process_msg(msg: Message) -> None:
         if msg.dst is not msg.src or msg.verb != I_:
             _check_msg_dst(msg)  # ? InvalidPacketError
 
-        if gwy.config.reduce_processing >= DONT_UPDATE_ENTITIES:
+        if reduce_processing >= DONT_UPDATE_ENTITIES:
             return
 
         # NOTE: here, msgs are routed only to devices: routing to other entities (i.e.
@@ -300,7 +312,7 @@ def process_msg(msg: Message) -> None:
             devices = (msg.dst,)  # dont: msg.dst._handle_msg(msg)
 
         elif msg.code == Code._1FC9 and msg.payload["phase"] == "offer":  # send to all
-            devices = (d for d in msg._gwy.devices if d is not msg.src)
+            devices = (d for d in gwy.devices if d is not msg.src)
 
         elif hasattr(msg.src, SZ_DEVICES):
             # .I --- 22:060293 --:------ 22:060293 0008 002 000C
@@ -13,6 +13,7 @@ import os
 import signal
 from concurrent import futures
 from datetime import datetime as dt
+from operator import attrgetter
 from threading import Lock
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Callable, Optional, TextIO
@@ -77,6 +78,10 @@ _LOGGER = logging.getLogger(__name__)
 if DEV_MODE:
     _LOGGER.setLevel(logging.DEBUG)
 
+_DEVICE_ID = attrgetter("id")  # sort by the id strs, rather than via Device.__lt__
+
+_DEFAULT_TRAITS = SCH_TRAITS({})  # NOTE: is shared, so treat as read-only
+
 
 class Engine:
     """The engine class."""
@@ -98,6 +103,7 @@ class Engine:
 
         self._include: dict[_DeviceIdT, dict] = {}  # aka known_list, and ?allow_list
         self._exclude: dict[_DeviceIdT, dict] = {}  # aka block_list
+        self._alias_by_id: dict[_DeviceIdT, str] = {}  # from the known_list
         self._unwanted: list[_DeviceIdT] = [
             NON_DEV_ADDR.id,
             NUL_DEV_ADDR.id,
@@ -371,6 +377,9 @@ class Gateway(Engine):
             self._input_file,
             **SCH_GLOBAL_CONFIG({k: v for k, v in kwargs.items() if k[:1] != "_"}),
         )
+        self._alias_by_id = {  # precomputed, for Message.__str__()
+            k: v[SZ_ALIAS][:18] for k, v in self._include.items() if v.get(SZ_ALIAS)
+        }
         set_pkt_logging_config(
             cc_console=self.config.reduce_processing >= DONT_CREATE_MESSAGES,
             **self.config.packet_log or {},
@@ -608,7 +617,10 @@ class Gateway(Engine):
                 )
 
         check_filter_lists(dev_id)
-        traits = SCH_TRAITS(self._include.get(dev_id, {}))
+        if known_dev := self._include.get(dev_id):
+            traits = SCH_TRAITS(known_dev)
+        else:  # most devices aren't in the known_list, so avoid re-validating {}
+            traits = _DEFAULT_TRAITS
 
         dev = self.device_by_id.get(dev_id)
         if not dev:
@@ -728,11 +740,15 @@ class Gateway(Engine):
 
     @property
     def params(self) -> dict:
-        return {SZ_DEVICES: {d.id: d.params for d in sorted(self.devices)}}
+        return {
+            SZ_DEVICES: {d.id: d.params for d in sorted(self.devices, key=_DEVICE_ID)}
+        }
 
     @property
     def status(self) -> dict:
-        return {SZ_DEVICES: {d.id: d.status for d in sorted(self.devices)}}
+        return {
+            SZ_DEVICES: {d.id: d.status for d in sorted(self.devices, key=_DEVICE_ID)}
+        }
 
     def send_cmd(  # FIXME
         self, cmd: Command, callback: Callable = None, **kwargs
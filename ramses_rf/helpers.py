@@ -49,10 +49,10 @@ def shrink(value: dict, keep_falsys: bool = False, keep_hints: bool = False) ->
 
     def walk(node):
         if isinstance(node, dict):
-            return {
-                k: walk(v)
+            return {  # walk(v) only once per item, as it is recursive
+                k: w
                 for k, v in node.items()
-                if (keep_hints or k[:1] != "_") and (keep_falsys or walk(v))
+                if (keep_hints or k[:1] != "_") and ((w := walk(v)) or keep_falsys)
             }
         elif isinstance(node, list):
             try:
@@ -148,6 +148,7 @@ def dev_id_to_hex_id(device_id: str) -> str:
     return f"{(int(dev_type) << 18) + int(device_id[-6:]):0>6X}"
 
 
+@lru_cache(maxsize=256)
 @typechecked
 def hex_id_to_dev_id(device_hex: str, friendly_id: bool = False) -> str:
     """Convert (say) '06368E' to '01:145038' (or 'CTL:145038')."""
@@ -365,7 +365,7 @@ class Command(Frame):
                 seqn,
                 *(a.id for a in addrs),
                 code,
-                f"{int(len(payload) / 2):03d}",
+                f"{len(payload) // 2:03d}",
                 payload,
             )
         )
@@ -841,7 +841,7 @@ class Command(Frame):
             raise ValueError(f"frag_num={frag_num}, but must be <= frag_cnt={frag_cnt}")
 
         header = "00230008" if zone_idx == 0xFA else f"{zone_idx:02X}200008"
-        frag_length = int(len(fragment) / 2)
+        frag_length = len(fragment) // 2
 
         payload = f"{header}{frag_length:02X}{frag_num:02X}{frag_cnt:02X}{fragment}"
         return cls.from_attrs(W_, ctl_id, Code._0404, payload, **kwargs)
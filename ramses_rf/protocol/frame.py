@@ -8,6 +8,7 @@ Provide the base class for commands (constructed/sent packets) and packets.
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
 from .address import NON_DEV_ADDR, NUL_DEV_ADDR, Address, pkt_addrs
 from .const import COMMAND_REGEX, DEV_ROLE_MAP, DEV_TYPE_MAP, __dev_mode__
@@ -48,6 +49,13 @@ if DEV_MODE:
     _LOGGER.setLevel(logging.DEBUG)
 
 
+# the payload regex ensures len(payload) is even, and 2 to 96 characters long
+_LEN_FIELDS = tuple(f"{i:03d}" for i in range(49))  # i.e. ("000", ... "048")
+
+# these trade memory for speed, and are for Frame._has_ctl
+_CTL_DEV_TYPES = frozenset((DEV_TYPE_MAP.CTL, DEV_TYPE_MAP.UFC, DEV_TYPE_MAP.PRG))
+_CODES_ONLY_FROM_CTL = frozenset(CODES_ONLY_FROM_CTL + (Code._31D9, Code._31DA))
+
 _CodeT = str
 _DeviceIdT = str
 _HeaderT = str
@@ -55,6 +63,17 @@ _PayloadT = str
 _VerbT = str
 
 
+@lru_cache(maxsize=256)  # many pkts are repeated verbatim (e.g. in logs, state)
+def _split_frame(frame: str) -> tuple[str, str, str, str, str, str]:
+    """Return the (verb, seqn, addrs, code, len, payload) fields of a frame.
+
+    Will raise InvalidPacketError if it is invalid.
+    """
+    if not (match := COMMAND_REGEX.match(frame)):
+        raise InvalidPacketError(f"Bad frame: invalid structure: >>>{frame}<<<")
+    return match.group("verb", "seqn", "addrs", "code", "len", "payload")
+
+
 class Frame:
     """The Frame class - used as a base by the Command and Packet classes.
 
@@ -70,7 +89,7 @@ class Frame:
     _addrs: tuple[Address, Address, Address]
     code: _CodeT
     len_: str  # FIXME: len_, _len & len(payload) / 2
-    _len: int  # int(len(payload) / 2)
+    _len: int  # len(payload) // 2
     payload: _PayloadT
 
     def __init__(self, frame: str) -> None:
@@ -80,26 +99,23 @@ class Frame:
         """
 
         self._frame = frame
-        if not COMMAND_REGEX.match(self._frame):
-            raise InvalidPacketError(f"Bad frame: invalid structure: >>>{frame}<<<")
+        fields = _split_frame(frame)  # is cached
 
-        fields = frame.lstrip().split(" ")
-
-        self.verb = frame[:2]  # cant use fields[0] as leading space ' I'
+        self.verb = fields[0]  # frame[:2], incl. any leading space: ' I'
         self.seqn = fields[1]  # frame[3:6]
-        self.code = fields[5]  # frame[37:41]
-        self.len_ = fields[6]  # frame[42:45]
-        self.payload = fields[7]  # frame[46:].split(" ")[0]
-        self._len = int(len(self.payload) / 2)
+        self.code = fields[3]  # frame[37:41]
+        self.len_ = fields[4]  # frame[42:45]
+        self.payload = fields[5]  # frame[46:]
+        self._len = len(self.payload) // 2
 
         try:
-            self.src, self.dst, *self._addrs = pkt_addrs(  # type: ignore[assignment]
-                " ".join(fields[i] for i in range(2, 5))  # frame[7:36]
+            self.src, self.dst, self._addrs = self._unpack_addrs(
+                fields[2]  # frame[7:36]
             )
         except InvalidPacketError as exc:  # will be: InvalidAddrSetError
             raise InvalidPacketError(f"Bad frame: invalid address set {exc}")
 
-        if len(self.payload) != int(self.len_) * 2:
+        if self.len_ != _LEN_FIELDS[self._len]:  # cheaper than int(self.len_)
             raise InvalidPacketError(
                 f"Bad frame: invalid payload: "
                 f"len({self.payload}) is not int('{self.len_}' * 2))"
@@ -115,6 +131,17 @@ class Frame:
 
         self._repr = None
 
+    @staticmethod
+    def _unpack_addrs(
+        addr_fragment: str,
+    ) -> tuple[Address, Address, tuple[Address, Address, Address]]:
+        """Return the src/dst addresses, and the (fixed-length) tuple of all three.
+
+        Will raise InvalidAddrSetError if the address fields are not valid.
+        """
+        addrs = pkt_addrs(addr_fragment)  # is cached
+        return addrs[0], addrs[1], addrs[2:]  # type: ignore[return-value]
+
     @classmethod  # for internal use only
     def _from_attrs(
         cls, verb: _VerbT, *addrs, code: _CodeT, payload: _PayloadT, seqn=None
@@ -122,7 +149,7 @@ class Frame:
         """Create a frame from its attributes (args, kwargs)."""
 
         seqn = seqn or "---"
-        len_ = f"{int(len(payload) / 2):03d}"
+        len_ = f"{len(payload) // 2:03d}"
 
         try:
             return cls(" ".join((verb, seqn, *addrs, code, len_, payload)))
@@ -135,17 +162,17 @@ class Frame:
         Raise an exception InvalidPacketError (InvalidAddrSetError) if it is not valid.
         """
 
-        if (seqn := self._frame[3:6]) == "...":
-            raise InvalidPacketError(f"Bad frame: deprecated seqn: {seqn}")
+        if self.seqn == "...":  # fields were parsed (once) by __init__()
+            raise InvalidPacketError(f"Bad frame: deprecated seqn: {self.seqn}")
 
         if not strict_checking:
             return
 
-        if len(self._frame[46:].split(" ")[0]) != int(self._frame[42:45]) * 2:
+        if self.len_ != _LEN_FIELDS[self._len]:
             raise InvalidPacketError("Bad frame: payload length mismatch")
 
         try:
-            self.src, self.dst, *self._addrs = pkt_addrs(self._frame[7:36])  # type: ignore[assignment]
+            self.src, self.dst, self._addrs = self._unpack_addrs(self._frame[7:36])
         except InvalidPacketError as exc:  # will be: InvalidAddrSetError
             raise InvalidPacketError(f"Bad frame: invalid address set: {exc}")
 
@@ -262,43 +289,33 @@ class Frame:
 
         # TODO: handle RQ/RP to/from HGI/RFG, handle HVAC
 
-        if {self.src.type, self.dst.type} & {
-            DEV_TYPE_MAP.CTL,
-            DEV_TYPE_MAP.UFC,
-            DEV_TYPE_MAP.PRG,
-        }:  # DEX
-            _LOGGER.debug(f"{self} # HAS controller (10)")
+        if self.src.type in _CTL_DEV_TYPES or self.dst.type in _CTL_DEV_TYPES:  # DEX
+            _LOGGER.debug("%s # HAS controller (10)", self)
             self._has_ctl_ = True
 
         # .I --- 12:010740 --:------ 12:010740 30C9 003 0008D9 # not ctl
         elif self.dst is self.src:  # (not needed?) & self.code == I_:
-            _LOGGER.debug(
-                f"{self} < "
-                + (
-                    "HAS"
-                    if self.code in CODES_ONLY_FROM_CTL + (Code._31D9, Code._31DA)
-                    else "no"
-                )
-                + " controller (20)"
-            )
             self._has_ctl_ = any(
                 (
                     self.code == Code._3B00 and self.payload[:2] == FC,
-                    self.code in CODES_ONLY_FROM_CTL + (Code._31D9, Code._31DA),
+                    self.code in _CODES_ONLY_FROM_CTL,
                 )
             )
+            _LOGGER.debug(
+                "%s < %s controller (20)", self, "HAS" if self._has_ctl_ else "no"
+            )
 
         # .I --- --:------ --:------ 10:050360 1FD4 003 002ABE # no ctl
         # .I 095 --:------ --:------ 12:126457 1F09 003 000BC2 # HAS ctl
         # .I --- --:------ --:------ 20:001473 31D9 003 000001 # ctl? (HVAC)
         elif self.dst.id == NON_DEV_ADDR.id:
-            _LOGGER.debug(f"{self} # HAS controller (21)")
+            _LOGGER.debug("%s # HAS controller (21)", self)
             self._has_ctl_ = self.src.type != DEV_TYPE_MAP.OTB  # DEX
 
         # .I --- 10:037879 --:------ 12:228610 3150 002 0000   # HAS ctl
         # .I --- 04:029390 --:------ 12:126457 1060 003 01FF01 # HAS ctl
         elif self.dst.type in (DEV_TYPE_MAP.DTS, DEV_TYPE_MAP.DT2):  # DEX
-            _LOGGER.debug(f"{self} # HAS controller (22)")
+            _LOGGER.debug("%s # HAS controller (22)", self)
             self._has_ctl_ = True
 
         # RQ --- 30:258720 10:050360 --:------ 3EF0 001 00           # UNKNOWN (99)
@@ -320,7 +337,7 @@ class Frame:
                 self.src.type,
                 self.dst.type,
             ):  # DEX
-                _LOGGER.warning(f"{self} # has_ctl - undetermined (99)")
+                _LOGGER.warning("%s # has_ctl - undetermined (99)", self)
             self._has_ctl_ = False
 
         return self._has_ctl_
@@ -506,7 +523,7 @@ def _pkt_idx(pkt) -> None | bool | str:  # _has_array, _has_ctl
         return None  # False  # TODO: return None (less precise) or risk false -ves?
 
     # mutex 4/4, CODE_IDX_UNKNOWN: an unknown code
-    _LOGGER.info(f"{pkt} # Unable to determine payload index (is probably OK)")
+    _LOGGER.info("%s # Unable to determine payload index (is probably OK)", pkt)
     return None
 
 
@@ -56,6 +56,50 @@ except ImportError:
         return wrapper
 
 
+# these trade memory for speed (payloads are uppercase, but commands may not be)
+_HEX_TO_U8 = {f"{i:02{x}}": i for x in ("X", "x") for i in range(256)}
+_HEX_TO_FLAG8_MSB = {
+    k: tuple((v >> x) & 1 for x in range(7, -1, -1)) for k, v in _HEX_TO_U8.items()
+}
+_HEX_TO_FLAG8_LSB = {k: v[::-1] for k, v in _HEX_TO_FLAG8_MSB.items()}
+_HEX_FROM_FLAG8 = {_HEX_TO_FLAG8_MSB[f"{i:02X}"]: f"{i:02X}" for i in range(256)}
+_NON_PRINTABLE = bytes(b for b in range(256) if not 31 < b < 127)  # for hex_to_str()
+_HEX_TO_BOOL = {"00": False, "C8": True, "FF": None}
+_HEX_FROM_BOOL = {False: "00", True: "C8"}
+_MISSING = object()  # for hex_to_temp(), as None/False are valid results
+_HEX_TO_TEMP = {  # for hex_to_temp(), the sentinel values
+    "31FF": None,  # means: N/A (== 127.99, 2s complement), signed?
+    "7EFF": False,  # possibly only for setpoints? unsigned?
+    "7FFF": None,  # also: FFFF?, means: N/A (== 327.67)
+}
+
+_AIR_QUALITY_BASIS = {  # for parse_air_quality()
+    "10": "voc",  # volatile compounds
+    "20": "co2",  # carbdon dioxide
+    "40": "rel_humidity",  # relative humidity
+}
+_SPEED_CAPABILITIES = tuple(  # for parse_capabilities(), as (bitmask, ability)
+    (1 << k, v)
+    for k, v in {
+        15: "off",
+        14: "low_med_high",  # 3,2,1 = high,med,low?
+        13: "timer",
+        12: "boost",
+        11: "auto",
+        10: "speed_4",
+        9: "speed_5",
+        8: "speed_6",
+        7: "speed_7",
+        6: "speed_8",
+        5: "speed_9",
+        4: "speed_10",
+        3: "auto_night",
+        2: "reserved",
+        1: "post_heater",
+        0: "pre_heater",
+    }.items()
+)
+
 # Sensor faults
 SZ_UNRELIABLE = "unreliable"
 SZ_TOO_HIGH = "out_of_range_high"
@@ -165,9 +209,7 @@ def hex_to_bool(value: HexStr2) -> Optional[bool]:  # either False, True or None
     """Convert a 2-char hex string into a boolean."""
     if not isinstance(value, str) or len(value) != 2:
         raise ValueError(f"Invalid value: {value}, is not a 2-char hex string")
-    if value == "FF":
-        return None
-    return {"00": False, "C8": True}[value]
+    return _HEX_TO_BOOL[value]
 
 
 @typechecked
@@ -177,7 +219,7 @@ def hex_from_bool(value: Optional[bool]) -> HexStr2:  # either 00, C8 or FF
         return "FF"
     if not isinstance(value, bool):
         raise ValueError(f"Invalid value: {value}, is not bool")
-    return {False: "00", True: "C8"}[value]
+    return _HEX_FROM_BOOL[value]
 
 
 @typechecked
@@ -187,10 +229,11 @@ def hex_to_date(value: HexStr8) -> Optional[str]:  # YY-MM-DD
         raise ValueError(f"Invalid value: {value}, is not an 8-char hex string")
     if value == "FFFFFFFF":
         return None
+    b = bytes.fromhex(value)
     return dt(
-        year=int(value[4:8], 16),
-        month=int(value[2:4], 16),
-        day=int(value[:2], 16) & 0b11111,  # 1st 3 bits: DayOfWeek
+        year=b[2] << 8 | b[3],
+        month=b[1],
+        day=b[0] & 0b11111,  # 1st 3 bits: DayOfWeek
     ).strftime("%Y-%m-%d")
 
 
@@ -224,15 +267,14 @@ def hex_to_dtm(value: HexStr12 | HexStr14) -> Optional[str]:  # from parsers
         raise ValueError(f"Invalid value: {value}, is not a 12/14-char hex string")
     if value[-12:] == "FF" * 6:
         return None
-    if len(value) == 12:
-        value = f"00{value}"
+    b = bytes.fromhex(value if len(value) == 14 else f"00{value}")
     return dt(
-        year=int(value[10:14], 16),
-        month=int(value[8:10], 16),
-        day=int(value[6:8], 16),
-        hour=int(value[4:6], 16) & 0b11111,  # 1st 3 bits: DayOfWeek
-        minute=int(value[2:4], 16),
-        second=int(value[:2], 16) & 0b1111111,  # 1st bit: used for DST
+        year=b[5] << 8 | b[6],
+        month=b[4],
+        day=b[3],
+        hour=b[2] & 0b11111,  # 1st 3 bits: DayOfWeek
+        minute=b[1],
+        second=b[0] & 0b1111111,  # 1st bit: used for DST
     ).isoformat(timespec="seconds")
 
 
@@ -267,12 +309,12 @@ def hex_to_dts(value: HexStr12) -> Optional[str]:
         return None
     _seqx = int(value, 16)
     return dt(
-        year=(_seqx & 0b1111111 << 24) >> 24,
-        month=(_seqx & 0b1111 << 36) >> 36,
-        day=(_seqx & 0b11111 << 31) >> 31,
-        hour=(_seqx & 0b11111 << 19) >> 19,
-        minute=(_seqx & 0b111111 << 13) >> 13,
-        second=(_seqx & 0b111111 << 7) >> 7,
+        year=_seqx >> 24 & 0b1111111,
+        month=_seqx >> 36 & 0b1111,
+        day=_seqx >> 31 & 0b11111,
+        hour=_seqx >> 19 & 0b11111,
+        minute=_seqx >> 13 & 0b111111,
+        second=_seqx >> 7 & 0b111111,
     ).strftime("%y-%m-%dT%H:%M:%S")
 
 
@@ -285,15 +327,13 @@ def hex_from_dts(dtm: Union[None, dt, str]) -> HexStr12:  # TODO: WIP
     if isinstance(dtm, str):
         dtm = dt.fromisoformat(dtm)  # TODO: YY-MM-DD, not YYYY-MM-DD
     (tm_year, tm_mon, tm_mday, tm_hour, tm_min, tm_sec, *_) = dtm.timetuple()
-    result = sum(
-        (
-            tm_year % 100 << 24,
-            tm_mon << 36,
-            tm_mday << 31,
-            tm_hour << 19,
-            tm_min << 13,
-            tm_sec << 7,
-        )
+    result = (
+        tm_year % 100 << 24
+        | tm_mon << 36
+        | tm_mday << 31
+        | tm_hour << 19
+        | tm_min << 13
+        | tm_sec << 7
     )
     return f"{result:012X}"
 
@@ -305,11 +345,11 @@ def hex_to_flag8(byte: HexByte, lsb: bool = False) -> list[int]:  # TODO: use tu
     If lsb==True, then the LSB is first.
     The `lsb` boolean is used so that flag[0] is `zone_idx["00"]`, etc.
     """
-    if not isinstance(byte, str) or len(byte) != 2:
+    if not isinstance(byte, str) or byte not in _HEX_TO_U8:
         raise ValueError(f"Invalid value: '{byte}', is not a 2-char hex string")
     if lsb:  # make LSB is first bit
-        return list((int(byte, 16) & (1 << x)) >> x for x in range(8))
-    return list((int(byte, 16) & (1 << x)) >> x for x in reversed(range(8)))
+        return list(_HEX_TO_FLAG8_LSB[byte])
+    return list(_HEX_TO_FLAG8_MSB[byte])
 
 
 @typechecked
@@ -320,9 +360,10 @@ def hex_from_flag8(flags: Iterable[int], lsb: bool = False) -> HexByte:
     """
     if not isinstance(flags, list) or len(flags) != 8:
         raise ValueError(f"Invalid value: '{flags}', is not a list of 8 bits")
-    if lsb:  # LSB is first bit
-        return f"{sum(x<<idx for idx, x in enumerate(flags)):02X}"
-    return f"{sum(x<<idx for idx, x in enumerate(reversed(flags))):02X}"
+    bits = flags[::-1] if lsb else flags  # if lsb, then LSB is first bit
+    if (result := _HEX_FROM_FLAG8.get(tuple(bits))) is None:  # not all 0s/1s
+        return f"{sum(x<<idx for idx, x in enumerate(reversed(bits))):02X}"
+    return result
 
 
 # TODO: add a wrapper for EF, & 0xF0
@@ -334,11 +375,11 @@ def hex_to_percent(
 
     The range is 0-100%, with resolution of 0.5% (high_res, 00-C8) or 1% (00-64).
     """
-    if not isinstance(value, str) or len(value) != 2:
+    if not isinstance(value, str) or (raw_result := _HEX_TO_U8.get(value)) is None:
         raise ValueError(f"Invalid value: {value}, is not a 2-char hex string")
     if value == "EF":  # TODO: when EF, when 7F?
         return None  # TODO: raise NotImplementedError
-    if (raw_result := int(value, 16)) & 0xF0 == 0xF0:
+    if raw_result & 0xF0 == 0xF0:
         return None  # TODO: raise errors
     result = float(raw_result) / (200 if high_res else 100)
     if result > 1.0:  # move to outer wrapper
@@ -352,7 +393,7 @@ def hex_to_str(value: str) -> Optional[str]:  # printable ASCII characters
     # result = bytearray.fromhex(value).split(b"\x7F")[0]  # TODO: needs checking
     if not isinstance(value, str):
         raise ValueError(f"Invalid value: {value}, is not a string")
-    result = bytearray([x for x in bytearray.fromhex(value) if 31 < x < 127])
+    result = bytes.fromhex(value).translate(None, _NON_PRINTABLE)
     return result.decode("ascii").strip() if result else None
 
 
@@ -369,12 +410,8 @@ def hex_to_temp(value: HexStr4) -> Union[None, bool, float]:
     """Convert a 2's complement 4-byte hex string to an float."""
     if not isinstance(value, str) or len(value) != 4:
         raise ValueError(f"Invalid value: {value}, is not a 4-char hex string")
-    if value == "31FF":  # means: N/A (== 127.99, 2s complement), signed?
-        return None
-    if value == "7EFF":  # possibly only for setpoints? unsigned?
-        return False
-    if value == "7FFF":  # also: FFFF?, means: N/A (== 327.67)
-        return None
+    if (result := _HEX_TO_TEMP.get(value, _MISSING)) is not _MISSING:
+        return result  # type: ignore[return-value]
     temp = int(value, 16)
     temp = (temp if temp < 2**15 else temp - 2**16) / 100
     if temp < -273.15:
@@ -429,16 +466,16 @@ def parser_valve_demand(value: HexStr2) -> dict[str, None | float | str]:
     """  # for a damper (restricts flow), or a valve (permits flow)
 
     # TODO: remove this...
-    if not isinstance(value, str) or len(value) != 2:
+    if not isinstance(value, str) or (raw_result := _HEX_TO_U8.get(value)) is None:
         raise ValueError(f"Invalid value: {value}, is not a 2-char hex string")
 
     if value == "EF":
         return {SZ_HEAT_DEMAND: None}  # Not Implemented
 
-    if int(value, 16) & 0xF0 == 0xF0:
+    if raw_result & 0xF0 == 0xF0:
         return _faulted_device(SZ_HEAT_DEMAND, value)
 
-    result = int(value, 16) / 200  # c.f. hex_to_percentage
+    result = raw_result / 200  # c.f. hex_to_percentage
     if result == 1.01:  # HACK
         result = 1.0
     elif result > 1.0:
@@ -466,18 +503,14 @@ def parse_air_quality(value: HexStr4) -> dict[str, None | float | str]:
     if value == "EF00":  # Not implemented
         return {SZ_AIR_QUALITY: None}
 
-    if int(value[:2], 16) & 0xF0 == 0xF0:
+    if (raw_level := int(value[:2], 16)) & 0xF0 == 0xF0:
         return _faulted_sensor(SZ_AIR_QUALITY, value)
 
-    level = int(value[:2], 16) / 200  # was: hex_to_percent(value[:2])
+    level = raw_level / 200  # was: hex_to_percent(value[:2])
     assert level <= 1.0, value[:2]  # TODO: raise exception
 
     assert value[2:] in ("10", "20", "40"), value[2:]  # TODO: remove assert
-    basis = {
-        "10": "voc",  # volatile compounds
-        "20": "co2",  # carbdon dioxide
-        "40": "rel_humidity",  # relative humidity
-    }.get(
+    basis = _AIR_QUALITY_BASIS.get(
         value[2:], f"unknown_{value[2:]}"
     )  # TODO: remove get/unknown
 
@@ -547,10 +580,10 @@ def _parse_fan_humidity(
     if value == "EF":  # Not implemented
         return {param_name: None}
 
-    if int(value, 16) & 0xF0 == 0xF0:
+    if (raw_value := int(value, 16)) & 0xF0 == 0xF0:
         return _faulted_sensor(param_name, value)
 
-    percentage = int(value, 16) / 100  # TODO: confirm not 200
+    percentage = raw_value / 100  # TODO: confirm not 200
     assert percentage <= 1.0, value  # TODO: raise exception if > 1.0?
 
     result = {param_name: percentage}  # was: percent_from_hex(value, high_res=False)
@@ -600,10 +633,11 @@ def _parse_fan_temp(param_name: str, value: HexStr4) -> dict[str, None | float |
     if value == "7FFF":  # Not implemented
         return {param_name: None}
 
-    if int(value[:2], 16) & 0xF0 == 0x80:  # or temperature < -273.15:
+    temp = int(value, 16)
+
+    if temp & 0xF000 == 0x8000:  # or temperature < -273.15:
         return _faulted_sensor(param_name, value)
 
-    temp = int(value, 16)
     temp = (temp if temp < 2**15 else temp - 2**16) / 100
     if temp <= -273:  # TODO: < 273.15?
         return _faulted_sensor(param_name, value)
@@ -620,16 +654,16 @@ def parse_bypass_position(value: HexStr2) -> dict[str, None | float | str]:
     """
 
     # TODO: remove this...
-    if not isinstance(value, str) or len(value) != 2:
+    if not isinstance(value, str) or (raw_result := _HEX_TO_U8.get(value)) is None:
         raise ValueError(f"Invalid value: {value}, is not a 2-char hex string")
 
     if value == "EF":  # Not implemented
         return {SZ_BYPASS_POSITION: None}
 
-    if int(value[:2], 16) & 0xF0 == 0xF0:
+    if raw_result & 0xF0 == 0xF0:
         return _faulted_device(SZ_BYPASS_POSITION, value)
 
-    bypass_pos = int(value, 16) / 200  # was: hex_to_percent(value)
+    bypass_pos = raw_result / 200  # was: hex_to_percent(value)
     assert bypass_pos <= 1.0, value
 
     return {SZ_BYPASS_POSITION: bypass_pos}
@@ -650,28 +684,10 @@ def parse_capabilities(value: HexStr4) -> dict[str, None | list | str]:
     if value == "7FFF":  # TODO: Not implemented???
         return {SZ_SPEED_CAP: None}
 
-    ABILITIES = {
-        15: "off",
-        14: "low_med_high",  # 3,2,1 = high,med,low?
-        13: "timer",
-        12: "boost",
-        11: "auto",
-        10: "speed_4",
-        9: "speed_5",
-        8: "speed_6",
-        7: "speed_7",
-        6: "speed_8",
-        5: "speed_9",
-        4: "speed_10",
-        3: "auto_night",
-        2: "reserved",
-        1: "post_heater",
-        0: "pre_heater",
-    }
-
     # assert value in ("0002", "4000", "4808", "F000", "F001", "F800", "F808"), value
 
-    return {SZ_SPEED_CAP: [v for k, v in ABILITIES.items() if int(value, 16) & 2**k]}
+    abilities = int(value, 16)
+    return {SZ_SPEED_CAP: [v for k, v in _SPEED_CAPABILITIES if abilities & k]}
 
 
 @typechecked  # 31DA[36:38]  # TODO: WIP (3 more bits), also 22F3?
@@ -689,18 +705,20 @@ def parse_fan_info(value: HexStr2) -> dict[str, None | float | str]:
     # if value == "EF":  # TODO: Not implemented???
     #     return {SZ_FAN_INFO: None}
 
-    assert int(value, 16) & 0x1F <= 0x19, f"invalid fan_info: {int(value, 16) & 0x1F}"
-    assert int(value, 16) & 0xE0 in (
+    fan_info = int(value, 16)
+
+    assert fan_info & 0x1F <= 0x19, f"invalid fan_info: {fan_info & 0x1F}"
+    assert fan_info & 0xE0 in (
         0x00,
         0x20,
         0x40,
         0x80,
-    ), f"invalid fan_info: {int(value, 16) & 0xE0}"
+    ), f"invalid fan_info: {fan_info & 0xE0}"
 
-    flags = list((int(value, 16) & (1 << x)) >> x for x in range(7, 4, -1))
+    flags = list((fan_info & (1 << x)) >> x for x in range(7, 4, -1))
 
     return {
-        SZ_FAN_INFO: _31DA_FAN_INFO[int(value, 16) & 0x1F],
+        SZ_FAN_INFO: _31DA_FAN_INFO[fan_info & 0x1F],
         f"_unknown_{SZ_FAN_INFO}_flags": flags,
     }
 
@@ -726,13 +744,13 @@ def _parse_fan_speed(param_name: str, value: HexStr2) -> dict[str, None | float
     """
 
     # TODO: remove this...
-    if not isinstance(value, str) or len(value) != 2:
+    if not isinstance(value, str) or (raw_result := _HEX_TO_U8.get(value)) is None:
         raise ValueError(f"Invalid value: {value}, is not a 2-char hex string")
 
     if value == "FF":  # Not implemented (is definitely FF, not EF!)
         return {param_name: None}
 
-    percentage = int(value, 16) / 200  # was: hex_to_percent(value)
+    percentage = raw_result / 200  # was: hex_to_percent(value)
     if percentage > 1.0:
         return _faulted_common(param_name, value)
 
@@ -11,7 +11,6 @@ import logging
 import re
 from datetime import datetime as dt
 from datetime import timedelta as td
-from functools import lru_cache
 
 from .address import Address
 from .const import (
@@ -27,7 +26,6 @@ from .exceptions import InvalidPacketError, InvalidPayloadError
 from .packet import Packet, fraction_expired
 from .parsers import PAYLOAD_PARSERS, parser_unknown
 from .ramses import CODE_IDX_COMPLEX, CODES_SCHEMA, RQ_IDX_COMPLEX
-from .schemas import SZ_ALIAS
 
 # TODO:
 # long-format msg.__str__ - alias columns don't line up
@@ -51,6 +49,52 @@ __all__ = ["Message"]
 
 CODE_NAMES = {k: v["name"] for k, v in CODES_SCHEMA.items()}
 
+_IDX_NAMES = {
+    Code._0002: "other_idx",  # non-evohome: hometronics
+    Code._0418: SZ_LOG_IDX,
+    Code._10A0: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
+    Code._1260: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
+    Code._1F41: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
+    Code._22C9: SZ_UFH_IDX,  # UFH circuit
+    Code._2389: "other_idx",  # anachronistic
+    Code._2D49: "other_idx",  # non-evohome: hometronics
+    Code._31D9: "hvac_id",
+    Code._31DA: "hvac_id",
+    Code._3220: "msg_id",
+}  # ALSO: SZ_DOMAIN_ID, SZ_ZONE_IDX
+
+# these trade memory for speed: DEV_TYPE_MAP.__getattr__() is relatively expensive
+_IDX_DEV_TYPES_AA = frozenset(
+    (
+        DEV_TYPE_MAP.CTL,
+        DEV_TYPE_MAP.UFC,
+        DEV_TYPE_MAP.HCW,  # ?remove (see above, rare)
+        DEV_TYPE_MAP.DTS,
+        DEV_TYPE_MAP.HGI,
+        DEV_TYPE_MAP.DT2,
+        DEV_TYPE_MAP.PRG,
+    )
+)  # for Message._idx()
+_IDX_DEV_TYPES_AB = frozenset(
+    (
+        DEV_TYPE_MAP.CTL,
+        DEV_TYPE_MAP.UFC,
+        DEV_TYPE_MAP.HCW,  # ?remove (see above, rare)
+        DEV_TYPE_MAP.HGI,
+        DEV_TYPE_MAP.PRG,
+    )
+)  # for Message._idx()
+_DEV_TYPE_UFC = DEV_TYPE_MAP.UFC
+
+_CTX_NAMES = {True: "[..]", False: "", None: "??"}  # for Message.__str__()
+
+_PAYLOAD_REGEXES = {  # these trade memory for speed: ~240 verb/code pairs
+    (code, verb): re.compile(regex)
+    for code, schema in CODES_SCHEMA.items()
+    for verb, regex in schema.items()
+    if verb in (I_, RP, RQ, W_)
+}  # for _check_msg_payload()
+
 MSG_FORMAT_10 = "|| {:10s} | {:10s} | {:2s} | {:16s} | {:^4s} || {}"
 MSG_FORMAT_18 = "|| {:18s} | {:18s} | {:2s} | {:16s} | {:^4s} || {}"
 
@@ -87,7 +131,9 @@ class Message:
         self.code: str = pkt.code
         self.len: int = pkt._len
 
-        self.code_name = CODE_NAMES.get(self.code, f"unknown_{self.code}")
+        if (code_name := CODE_NAMES.get(self.code)) is None:  # don't format eagerly
+            code_name = f"unknown_{self.code}"
+        self.code_name = code_name
 
         self._payload = self._validate(self._pkt.payload)  # ? raise InvalidPacketError
 
@@ -102,8 +148,13 @@ class Message:
     def __str__(self) -> str:
         """Return a brief readable string representation of this object."""
 
+        if self._str is not None:
+            return self._str
+
+        use_aliases = self._gwy.config.use_aliases  # look this up only once
+
         def ctx(pkt) -> str:
-            ctx = {True: "[..]", False: "", None: "??"}.get(pkt._ctx, pkt._ctx)
+            ctx = _CTX_NAMES.get(pkt._ctx, pkt._ctx)
             if not ctx and pkt.payload[:2] not in ("00", FF):
                 return f"({pkt.payload[:2]})"
             return ctx
@@ -114,17 +165,13 @@ class Message:
             Use the alias, if one exists, or use a slug instead of a device type.
             """
 
+            if use_aliases:
+                return self._gwy._alias_by_id.get(addr.id) or f" {addr.id}"
             try:
-                if self._gwy.config.use_aliases:
-                    return self._gwy._include[addr.id][SZ_ALIAS][:18]
-                else:
-                    return f"{self._gwy.device_by_id[addr.id]._SLUG}:{addr.id[3:]}"
+                return f"{self._gwy.device_by_id[addr.id]._SLUG}:{addr.id[3:]}"
             except KeyError:
                 return f" {addr.id}"
 
-        if self._str is not None:
-            return self._str
-
         if self.src.id == self._addrs[0].id:
             name_0 = display_name(self.src)
             name_1 = "" if self.dst is self.src else display_name(self.dst)
@@ -132,7 +179,7 @@ class Message:
             name_0 = ""
             name_1 = display_name(self.src)
 
-        _format = MSG_FORMAT_18 if self._gwy.config.use_aliases else MSG_FORMAT_10
+        _format = MSG_FORMAT_18 if use_aliases else MSG_FORMAT_10
         self._str = _format.format(
             name_0, name_1, self.verb, self.code_name, ctx(self._pkt), self.payload
         )
@@ -184,55 +231,26 @@ class Message:
 
         # .I --- 01:145038 --:------ 01:145038 3B00 002 FCC8
 
-        IDX_NAMES = {
-            Code._0002: "other_idx",  # non-evohome: hometronics
-            Code._0418: SZ_LOG_IDX,
-            Code._10A0: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
-            Code._1260: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
-            Code._1F41: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
-            Code._22C9: SZ_UFH_IDX,  # UFH circuit
-            Code._2389: "other_idx",  # anachronistic
-            Code._2D49: "other_idx",  # non-evohome: hometronics
-            Code._31D9: "hvac_id",
-            Code._31DA: "hvac_id",
-            Code._3220: "msg_id",
-        }  # ALSO: SZ_DOMAIN_ID, SZ_ZONE_IDX
-
-        if self._pkt._idx in (True, False) or self.code in CODE_IDX_COMPLEX:
+        code, idx = self.code, self._pkt._idx  # avoid repeated attr lookups
+
+        if idx in (True, False) or code in CODE_IDX_COMPLEX:
             return {}  # above was: CODE_IDX_COMPLEX + (Code._3150):
 
-        if self.code in (Code._3220,):  # FIXME: should be _SIMPLE
+        if code in (Code._3220,):  # FIXME: should be _SIMPLE
             return {}
 
         # .I 068 03:201498 --:------ 03:201498 30C9 003 0106D6 # rare
 
+        src_type, dst_type = self.src.type, self.dst.type
+
         # .I --- 00:034798 --:------ 12:126457 2309 003 0201F4
-        if True and not {self.src.type, self.dst.type} & {
-            DEV_TYPE_MAP.CTL,
-            DEV_TYPE_MAP.UFC,
-            DEV_TYPE_MAP.HCW,  # ?remove (see above, rare)
-            DEV_TYPE_MAP.DTS,
-            DEV_TYPE_MAP.HGI,
-            DEV_TYPE_MAP.DT2,
-            DEV_TYPE_MAP.PRG,
-        }:  # DEX
-            assert self._pkt._idx == "00", "What!! (AA)"
+        if True and not {src_type, dst_type} & _IDX_DEV_TYPES_AA:  # DEX
+            assert idx == "00", "What!! (AA)"
             return {}
 
         # .I 035 --:------ --:------ 12:126457 30C9 003 017FFF
-        if (
-            True
-            and self.src.type == self.dst.type
-            and self.src.type
-            not in (
-                DEV_TYPE_MAP.CTL,
-                DEV_TYPE_MAP.UFC,
-                DEV_TYPE_MAP.HCW,  # ?remove (see above, rare)
-                DEV_TYPE_MAP.HGI,
-                DEV_TYPE_MAP.PRG,
-            )
-        ):  # DEX
-            assert self._pkt._idx == "00", "What!! (AB)"
+        if True and src_type == dst_type and src_type not in _IDX_DEV_TYPES_AB:  # DEX
+            assert idx == "00", "What!! (AB)"
             return {}
 
         # .I --- 04:029362 --:------ 12:126457 3150 002 0162
@@ -250,22 +268,22 @@ class Message:
         #     assert self._pkt._idx == "00", "What!! (BB)"
         #     return {}
 
-        if self.src.type == self.dst.type and not getattr(
+        if src_type == dst_type and not getattr(
             self.src, "_is_controller", True
         ):  # DEX
-            assert self._pkt._idx == "00", "What!! (BC)"
+            assert idx == "00", "What!! (BC)"
             return {}
 
         # TODO: also 000C (but is a complex idx)
         # TODO: also 3150 (when not domain, and will be array if so)
-        if self.code in (Code._000A, Code._2309) and self.src.type == DEV_TYPE_MAP.UFC:
-            return {IDX_NAMES[Code._22C9]: self._pkt._idx}
+        if code in (Code._000A, Code._2309) and src_type == _DEV_TYPE_UFC:
+            return {_IDX_NAMES[Code._22C9]: idx}
 
-        index_name = IDX_NAMES.get(
-            self.code, SZ_DOMAIN_ID if self._pkt._idx[:1] == "F" else SZ_ZONE_IDX
+        index_name = _IDX_NAMES.get(
+            code, SZ_DOMAIN_ID if idx[:1] == "F" else SZ_ZONE_IDX
         )
 
-        return {index_name: self._pkt._idx}
+        return {index_name: idx}
 
     @property
     def _expired(self) -> bool:
@@ -335,7 +353,10 @@ class Message:
             if isinstance(result, list):
                 return result
             if isinstance(result, dict):
-                return {**self._idx, **result}
+                if idx := self._idx:  # is a new dict, and its key must come first
+                    idx.update(result)
+                    return idx
+                return result
 
             raise TypeError(f"Invalid payload type: {type(result)}")
 
@@ -365,14 +386,6 @@ class Message:
             raise InvalidPacketError from exc
 
 
-@lru_cache(maxsize=256)
-def re_compile_re_match(regex: str, string: str) -> bool:  # Optional[Match[Any]]
-    # TODO: confirm this does speed things up
-    # Python has its own caching of re.complile, _MAXCACHE = 512
-    # https://github.com/python/cpython/blob/3.10/Lib/re.py
-    return re.compile(regex).match(string)  # type: ignore[return-value]
-
-
 def _check_msg_payload(msg: Message, payload: str) -> None:
     """Validate the packet's payload against its verb/code pair.
 
@@ -383,18 +396,20 @@ def _check_msg_payload(msg: Message, payload: str) -> None:
     """
 
     try:
-        _ = repr(msg._pkt)  # HACK: ? raise InvalidPayloadError
-
-        if msg.code not in CODES_SCHEMA:
-            raise InvalidPacketError(f"Unknown code: {msg.code}")
-
-        try:
-            regex = CODES_SCHEMA[msg.code][msg.verb]
-        except KeyError:
+        try:  # HACK: as was repr(msg._pkt), but without the cost of formatting it
+            _ = msg._pkt._hdr, msg._pkt._ctx  # calculate (and cache) these now
+        except (InvalidPacketError, NotImplementedError):  # as per Packet.__repr__
+            pass
+
+        if (regex := _PAYLOAD_REGEXES.get((msg.code, msg.verb))) is None:
+            if msg.code not in CODES_SCHEMA:
+                raise InvalidPacketError(f"Unknown code: {msg.code}")
             raise InvalidPacketError(f"Unknown verb/code pair: {msg.verb}/{msg.code}")
 
-        if not re_compile_re_match(regex, payload):
-            raise InvalidPayloadError(f"Payload doesn't match '{regex}': {payload}")
+        if not regex.match(payload):
+            raise InvalidPayloadError(
+                f"Payload doesn't match '{regex.pattern}': {payload}"
+            )
 
     except InvalidPacketError as exc:  # incl. InvalidPayloadError
         # HGI80s can do what they like...
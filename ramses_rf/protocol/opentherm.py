@@ -7,6 +7,7 @@ from __future__ import annotations
 import logging
 import struct
 from datetime import timedelta as td
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import Callable, Dict
 
@@ -971,60 +972,66 @@ def parity(x: int) -> int:
     return x & 1
 
 
+def _flag8(byte: str, *args) -> list:
+    """Split a byte (as a str) into a list of 8 bits.
+
+    In the original payload (the OT specification), the lsb is bit 0 (the last bit),
+    so the order of bits is reversed here, giving flags[0] (the 1st bit in the
+    array) as the lsb.
+    """
+    value = bytes.fromhex(byte)[0]
+    return [(value >> x) & 1 for x in range(8)]
+
+
+def _u8(byte: str, *args) -> int:
+    """Convert a byte (as a str) into an unsigned int."""
+    return struct.unpack(">B", bytes.fromhex(byte))[0]
+
+
+def _s8(byte: str, *args) -> int:
+    """Convert a byte (as a str) into a signed int."""
+    return struct.unpack(">b", bytes.fromhex(byte))[0]
+
+
+def _f8_8(high_byte: str, low_byte: str) -> float:
+    """Convert 2 bytes (as strs) into an OpenTherm f8_8 value."""
+    if high_byte == low_byte == "FF":  # TODO: move up to parser?
+        raise ValueError()
+    return float(_s16(high_byte, low_byte) / 256)
+
+
+def _u16(high_byte: str, low_byte: str) -> int:
+    """Convert 2 bytes (as strs) into an unsigned int."""
+    if high_byte == low_byte == "FF":  # TODO: move up to parser?
+        raise ValueError()
+    return struct.unpack(">H", bytes.fromhex(high_byte + low_byte))[0]
+
+
+def _s16(high_byte: str, low_byte: str) -> int:
+    """Convert 2 bytes (as strs) into a signed int."""
+    if high_byte == low_byte == "FF":  # TODO: move up to parser?
+        raise ValueError()
+    return struct.unpack(">h", bytes.fromhex(high_byte + low_byte))[0]
+
+
+_DATA_TYPES: Dict[str, Callable] = {
+    FLAG8: _flag8,
+    U8: _u8,
+    S8: _s8,
+    F8_8: _f8_8,
+    U16: _u16,
+    S16: _s16,
+}
+
+
 def msg_value(val_seqx: str, val_type: str) -> None | float | int | list | str:
     """Make this the docstring."""
 
     # based upon: https://github.com/mvn23/pyotgw/blob/master/pyotgw/protocol.py
 
-    def flag8(byte: str, *args) -> list:
-        """Split a byte (as a str) into a list of 8 bits.
-
-        In the original payload (the OT specification), the lsb is bit 0 (the last bit),
-        so the order of bits is reversed here, giving flags[0] (the 1st bit in the
-        array) as the lsb.
-        """
-        return [(bytes.fromhex(byte)[0] & (1 << x)) >> x for x in range(8)]
-
-    def u8(byte: str, *args) -> int:
-        """Convert a byte (as a str) into an unsigned int."""
-        return struct.unpack(">B", bytes.fromhex(byte))[0]
-
-    def s8(byte: str, *args) -> int:
-        """Convert a byte (as a str) into a signed int."""
-        return struct.unpack(">b", bytes.fromhex(byte))[0]
-
-    def f8_8(high_byte: str, low_byte: str) -> float:
-        """Convert 2 bytes (as strs) into an OpenTherm f8_8 value."""
-        if high_byte == low_byte == "FF":  # TODO: move up to parser?
-            raise ValueError()
-        return float(s16(high_byte, low_byte) / 256)
-
-    def u16(high_byte: str, low_byte: str) -> int:
-        """Convert 2 bytes (as strs) into an unsigned int."""
-        if high_byte == low_byte == "FF":  # TODO: move up to parser?
-            raise ValueError()
-        buf = struct.pack(">BB", u8(high_byte), u8(low_byte))
-        return int(struct.unpack(">H", buf)[0])
-
-    def s16(high_byte: str, low_byte: str) -> int:
-        """Convert 2 bytes (as strs) into a signed int."""
-        if high_byte == low_byte == "FF":  # TODO: move up to parser?
-            raise ValueError()
-        buf = struct.pack(">bB", s8(high_byte), u8(low_byte))
-        return int(struct.unpack(">h", buf)[0])
-
-    DATA_TYPES: Dict[str, Callable] = {
-        FLAG8: flag8,
-        U8: u8,
-        S8: s8,
-        F8_8: f8_8,
-        U16: u16,
-        S16: s16,
-    }
-
-    if val_type in DATA_TYPES:
+    if val_type in _DATA_TYPES:
         try:
-            return DATA_TYPES[val_type](val_seqx[:2], val_seqx[2:])
+            return _DATA_TYPES[val_type](val_seqx[:2], val_seqx[2:])
         except ValueError:
             return None
     return val_seqx
@@ -1041,17 +1048,20 @@ def _decode_flags(frame: str, data_id: int) -> dict:
     return flag_schema
 
 
+@lru_cache(maxsize=256)  # OT frames are highly repetitive (NB: results are shared)
 def decode_frame(frame: str) -> tuple[str, int, dict, dict]:
     if not isinstance(frame, str) or len(frame) != 8:
         raise TypeError(f"Invalid frame (type or length): {frame}")
 
-    if int(frame[:2], 16) // 0x80 != parity(int(frame, 16) & 0x7FFFFFFF):
-        raise ValueError(f"Invalid parity bit: 0b{int(frame[:2], 16) // 0x80}")
+    frame_hb = int(frame[:2], 16)  # the parity bit, msg-type & spare bits
+
+    if frame_hb // 0x80 != parity(int(frame, 16) & 0x7FFFFFFF):
+        raise ValueError(f"Invalid parity bit: 0b{frame_hb // 0x80}")
 
-    if int(frame[:2], 16) & 0x0F != 0x00:
-        raise ValueError(f"Invalid spare bits: 0b{int(frame[:2], 16) & 0x0F:04b}")
+    if frame_hb & 0x0F != 0x00:
+        raise ValueError(f"Invalid spare bits: 0b{frame_hb & 0x0F:04b}")
 
-    msg_type = (int(frame[:2], 16) & 0x70) >> 4
+    msg_type = (frame_hb & 0x70) >> 4
 
     # if msg_type == 0b011:  # NOTE: this msg-type may no longer be reserved (R8820?)
     #     raise ValueError(f"Reserved msg-type (0b{msg_type:03b})")
@@ -1116,7 +1126,7 @@ def decode_frame(frame: str) -> tuple[str, int, dict, dict]:
 #     for k, v in OPENTHERM_MESSAGES.items()
 #     if not isinstance(v[VAL], dict)
 #     and not isinstance(v.get(VAR), dict)
-#     and v[VAL] not in msg_value.DATA_TYPES
+#     and v[VAL] not in _DATA_TYPES
 # ], "Corrupt OPENTHERM_MESSAGES schema"
 
 
@@ -99,13 +99,25 @@ class Packet(Frame):
 
             super()._validate(strict_checking=strict_checking)  # no RSSI
 
-            _PKT_LOGGER.info("", extra=self.__dict__)  # the packet.log line
+            _PKT_LOGGER.info("", extra=self._log_extra())  # the packet.log line
 
         except InvalidPacketError as exc:  # incl. InvalidAddrSetError
             if self._frame or self.error_text:
-                _PKT_LOGGER.warning("%s", exc, extra=self.__dict__)
+                _PKT_LOGGER.warning("%s", exc, extra=self._log_extra())
             raise exc
 
+    def _log_extra(self) -> dict:
+        """Return only those attrs used by the packet log's formatters/filters.
+
+        Is much cheaper than passing self.__dict__, which is copied into every record.
+        """
+        return {
+            "_frame": self._frame,
+            "_rssi": self._rssi,
+            "comment": self.comment,
+            "error_text": self.error_text,
+        }
+
     def __repr__(self) -> str:
         """Return an unambiguous string representation of this object."""
         try:
@@ -132,7 +144,7 @@ class Packet(Frame):
         return self._frame[4:] == other._frame[4:]
 
     @staticmethod
-    def _partition(pkt_line: str) -> tuple[str, str, str]:  # map[str]
+    def _partition(pkt_line: str) -> tuple[str, str, str]:
         """Partition a packet line into its three parts.
 
         Format: packet[ < parser-hint: ...][ * evofw3-err_msg][ # evofw3-comment]
@@ -141,7 +153,7 @@ class Packet(Frame):
         fragment, _, comment = pkt_line.partition("#")
         fragment, _, err_msg = fragment.partition("*")
         pkt_str, _, _ = fragment.partition("<")  # discard any parser hints
-        return map(str.strip, (pkt_str, err_msg, comment))  # type: ignore[return-value]
+        return pkt_str.strip(), err_msg.strip(), comment.strip()
 
     @property
     def _expired(self) -> bool | float:
@@ -216,15 +228,14 @@ def pkt_timeout(pkt: Packet) -> None | td:  # NOTE: import OtbGateway ??
         return _TD_SECONDS_360
 
     if pkt.code == Code._3220:  # FIXME
-        # if pkt.payload[4:6] in WRITE_MSG_IDS and Write-Data:  # TODO
+        msg_id = pkt.payload[4:6]
+        # if msg_id in WRITE_MSG_IDS and Write-Data:  # TODO
         #     return _TD_SECONDS_003
-        if pkt.payload[4:6] in SCHEMA_MSG_IDS:
-            return None  # SCHEMA_MSG_IDS[pkt.payload[4:6]]
-        if pkt.payload[4:6] in PARAMS_MSG_IDS:
-            return PARAMS_MSG_IDS[pkt.payload[4:6]]
-        if pkt.payload[4:6] in STATUS_MSG_IDS:
-            return STATUS_MSG_IDS[pkt.payload[4:6]]
-        return _TD_MINUTES_005
+        if msg_id in SCHEMA_MSG_IDS:
+            return None  # SCHEMA_MSG_IDS[msg_id]
+        if (timeout := PARAMS_MSG_IDS.get(msg_id)) is not None:
+            return timeout
+        return STATUS_MSG_IDS.get(msg_id, _TD_MINUTES_005)
 
     # if pkt.code in (Code._3B00, Code._3EF0, ):  # TODO: 0008, 3EF0, 3EF1
     #     return td(minutes=6.7)  # TODO: WIP
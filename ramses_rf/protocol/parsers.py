@@ -132,6 +132,17 @@ from .const import (  # noqa: F401, isort: skip, pylint: disable=unused-import
 
 _2411_TABLE = {k: v["description"] for k, v in _2411_PARAMS_SCHEMA.items()}
 
+_HEX_TO_QUARTERS = {f"{i:02X}": i / 4 for i in range(256)}  # for parser_1100()
+
+_0009_FAILSAFE_ENABLED = {"00": False, "01": True}  # for parser_0009()
+
+_3B00_DOMAIN_ID = {  # for parser_3b00()
+    DEV_TYPE_MAP.CTL: FC,
+    DEV_TYPE_MAP.BDR: "00",
+    DEV_TYPE_MAP.PRG: FC,
+}
+_3B00_CTL_TYPES = (DEV_TYPE_MAP.CTL, DEV_TYPE_MAP.PRG)  # for parser_3b00()
+
 _INFORM_DEV_MSG = "Support the development of ramses_rf by reporting this packet"
 
 LOOKUP_PUZZ = {
@@ -361,7 +372,7 @@ def parser_0009(payload, msg) -> dict | list:
         assert seqx[:2] in (F9, FC) or int(seqx[:2], 16) < 16
         return {
             SZ_DOMAIN_ID if seqx[:1] == "F" else SZ_ZONE_IDX: seqx[:2],
-            "failsafe_enabled": {"00": False, "01": True}.get(seqx[2:4]),
+            "failsafe_enabled": _0009_FAILSAFE_ENABLED.get(seqx[2:4]),
             f"{SZ_UNKNOWN}_0": seqx[4:],
         }
 
@@ -369,7 +380,7 @@ def parser_0009(payload, msg) -> dict | list:
         return [_parser(payload[i : i + 6]) for i in range(0, len(payload), 6)]
 
     return {
-        "failsafe_enabled": {"00": False, "01": True}.get(payload[2:4]),
+        "failsafe_enabled": _0009_FAILSAFE_ENABLED.get(payload[2:4]),
         f"{SZ_UNKNOWN}_0": payload[4:],
     }
 
@@ -686,15 +697,19 @@ def parser_0418(payload, msg) -> dict:
 
     # assert int(payload[4:6], 16) < 64, f"Unexpected log_idx: 0x{payload[4:6]}"
 
-    if hex_to_dts(payload[18:30]) is None:  # a null log entry
+    if payload[18:30] == "00000000007F":  # a null log entry (most are)
         return {"log_entry": None}
 
+    timestamp = hex_to_dts(payload[18:30])
+
+    domain_id = int(payload[10:12], 16)  # is a zone_idx if < 16
+
     try:
         assert payload[2:4] in FAULT_STATE, f"fault state: {payload[2:4]}"
         assert payload[8:10] in FAULT_TYPE, f"fault type: {payload[8:10]}"
         assert payload[12:14] in FAULT_DEVICE_CLASS, f"device class: {payload[12:14]}"
         # 1C: 'Comms fault, Actuator': seen with boiler relays
-        assert int(payload[10:12], 16) < 16 or (
+        assert domain_id < 16 or (
             payload[10:12] in ("1C", F6, F9, FA, FC)
         ), f"domain id: {payload[10:12]}"
     except AssertionError as exc:
@@ -703,7 +718,7 @@ def parser_0418(payload, msg) -> dict:
         )
 
     result = {
-        "timestamp": hex_to_dts(payload[18:30]),
+        "timestamp": timestamp,
         "state": FAULT_STATE.get(payload[2:4], payload[2:4]),
         "type": FAULT_TYPE.get(payload[8:10], payload[8:10]),
         SZ_DEVICE_CLASS: FAULT_DEVICE_CLASS.get(payload[12:14], payload[12:14]),
@@ -717,7 +732,7 @@ def parser_0418(payload, msg) -> dict:
         result[SZ_DEVICE_CLASS] = DEV_ROLE_MAP[DEV_ROLE.HT1]  # speculative
 
     if payload[12:14] != "00":  # TODO: Controller
-        key_name = SZ_ZONE_IDX if int(payload[10:12], 16) < 16 else SZ_DOMAIN_ID
+        key_name = SZ_ZONE_IDX if domain_id < 16 else SZ_DOMAIN_ID
         result.update({key_name: payload[10:12]})
 
     if payload[38:] == "000002":  # "00:000002 for Unknown?
@@ -786,7 +801,7 @@ def parser_1030(payload, msg) -> dict:
 
         return {param_name: int(seqx[4:], 16)}
 
-    assert (msg.len - 1) / 3 in (2, 5), msg.len
+    assert msg.len in (7, 16), msg.len  # i.e. (msg.len - 1) / 3 in (2, 5)
     # assert payload[30:] in ("00", "01"), payload[30:]
 
     params = [_parser(payload[i : i + 6]) for i in range(2, len(payload), 6)]
@@ -995,9 +1010,13 @@ def parser_1100(payload, msg) -> dict:
     if msg.verb == RQ and msg.len == 1:  # some RQs have a payload (why?)
         return complex_idx(payload[:2])
 
-    assert int(payload[2:4], 16) / 4 in range(1, 13), payload[2:4]
-    assert int(payload[4:6], 16) / 4 in range(1, 31), payload[4:6]
-    assert int(payload[6:8], 16) / 4 in range(0, 16), payload[6:8]
+    cycle_rate = _HEX_TO_QUARTERS[payload[2:4]]
+    min_on_time = _HEX_TO_QUARTERS[payload[4:6]]
+    min_off_time = _HEX_TO_QUARTERS[payload[6:8]]
+
+    assert cycle_rate in range(1, 13), payload[2:4]
+    assert min_on_time in range(1, 31), payload[4:6]
+    assert min_off_time in range(0, 16), payload[6:8]
 
     # for:             TPI              // heatpump
     #  - cycle_rate:   6 (3, 6, 9, 12)  // ?? (1-9)
@@ -1006,9 +1025,9 @@ def parser_1100(payload, msg) -> dict:
 
     def _parser(seqx) -> dict:
         return {
-            "cycle_rate": int(int(payload[2:4], 16) / 4),  # cycles/hour
-            "min_on_time": int(payload[4:6], 16) / 4,  # min
-            "min_off_time": int(payload[6:8], 16) / 4,  # min
+            "cycle_rate": int(cycle_rate),  # cycles/hour
+            "min_on_time": min_on_time,  # min
+            "min_off_time": min_off_time,  # min
             f"_{SZ_UNKNOWN}_0": payload[8:10],  # always 00, FF?
         }
 
@@ -1183,23 +1202,22 @@ def parser_1f09(payload, msg) -> dict:
 @parser_decorator  # dhw_mode
 def parser_1f41(payload, msg) -> dict:
     # 053 RP --- 01:145038 18:013393 --:------ 1F41 006 00FF00FFFFFF  # no stored DHW
-    assert payload[4:6] in ZON_MODE_MAP, f"{payload[4:6]} (0xjj)"
-    assert (
-        payload[4:6] == ZON_MODE_MAP.TEMPORARY or msg.len == 6
-    ), f"{msg!r}: expected length 6"
-    assert (
-        payload[4:6] != ZON_MODE_MAP.TEMPORARY or msg.len == 12
-    ), f"{msg!r}: expected length 12"
+    mode = payload[4:6]
+    has_until = mode == ZON_MODE_MAP.TEMPORARY  # only this mode has a dtm
+
+    assert mode in ZON_MODE_MAP, f"{mode} (0xjj)"
+    assert has_until or msg.len == 6, f"{msg!r}: expected length 6"
+    assert not has_until or msg.len == 12, f"{msg!r}: expected length 12"
     assert (
         payload[6:12] == "FFFFFF"
     ), f"{msg!r}: expected FFFFFF instead of '{payload[6:12]}'"
 
-    result = {SZ_MODE: ZON_MODE_MAP.get(payload[4:6])}
+    result = {SZ_MODE: ZON_MODE_MAP.get(mode)}
     if payload[2:4] != "FF":
         result["active"] = {"00": False, "01": True, "FF": None}[payload[2:4]]
     # if payload[4:6] == ZON_MODE_MAP.COUNTDOWN:
     #     result[SZ_UNTIL] = dtm_from_hex(payload[6:12])
-    if payload[4:6] == ZON_MODE_MAP.TEMPORARY:
+    if has_until:
         result[SZ_UNTIL] = hex_to_dtm(payload[12:24])
 
     return result
@@ -1734,28 +1752,30 @@ def parser_2349(payload, msg) -> dict:
 
     assert msg.len in (7, 13), f"expected len 7,13, got {msg.len}"
 
-    assert payload[6:8] in ZON_MODE_MAP, f"{SZ_UNKNOWN} zone_mode: {payload[6:8]}"
+    mode = payload[6:8]
+
+    assert mode in ZON_MODE_MAP, f"{SZ_UNKNOWN} zone_mode: {mode}"
     result = {
-        SZ_MODE: ZON_MODE_MAP.get(payload[6:8]),
+        SZ_MODE: ZON_MODE_MAP.get(mode),
         SZ_SETPOINT: hex_to_temp(payload[2:6]),
     }
 
     if msg.len >= 7:  # has a dtm if mode == "04"
         if payload[8:14] == "FF" * 3:  # 03/FFFFFF OK if W?
-            assert payload[6:8] != ZON_MODE_MAP.COUNTDOWN, f"{payload[6:8]} (0x00)"
+            assert mode != ZON_MODE_MAP.COUNTDOWN, f"{mode} (0x00)"
         else:
-            assert payload[6:8] == ZON_MODE_MAP.COUNTDOWN, f"{payload[6:8]} (0x01)"
+            assert mode == ZON_MODE_MAP.COUNTDOWN, f"{mode} (0x01)"
             result[SZ_DURATION] = int(payload[8:14], 16)
 
     if msg.len >= 13:
         if payload[14:] == "FF" * 6:
-            assert payload[6:8] in (
+            assert mode in (
                 ZON_MODE_MAP.FOLLOW,
                 ZON_MODE_MAP.PERMANENT,
-            ), f"{payload[6:8]} (0x02)"
+            ), f"{mode} (0x02)"
             result[SZ_UNTIL] = None  # TODO: remove?
         else:
-            assert payload[6:8] != ZON_MODE_MAP.PERMANENT, f"{payload[6:8]} (0x03)"
+            assert mode != ZON_MODE_MAP.PERMANENT, f"{mode} (0x03)"
             result[SZ_UNTIL] = hex_to_dtm(payload[14:26])
 
     return result
@@ -1781,18 +1801,18 @@ def parser_2400(payload, msg) -> dict:
 
 @parser_decorator  # unknown_2401, from OTB
 def parser_2401(payload, msg) -> dict:
+    value_2 = int(payload[4:6], 0x10)
+
     try:
         assert payload[2:4] == "00", f"byte 1: {payload[2:4]}"
-        assert (
-            int(payload[4:6], 16) & 0b11110000 == 0
-        ), f"byte 2: {hex_to_flag8(payload[4:6])}"
+        assert value_2 & 0b11110000 == 0, f"byte 2: {hex_to_flag8(payload[4:6])}"
         assert int(payload[6:], 0x10) <= 200, f"byte 3: {payload[6:]}"
     except AssertionError as exc:
         _LOGGER.warning(f"{msg!r} < {_INFORM_DEV_MSG} ({exc})")
 
     return {
         SZ_PAYLOAD: payload,
-        "_value_2": int(payload[4:6], 0x10),
+        "_value_2": value_2,
         "_flags_2": hex_to_flag8(payload[4:6]),
         "_percent_3": hex_to_percent(payload[6:]),
     }
@@ -2074,15 +2094,17 @@ def parser_3150(payload, msg) -> dict | list:
 
     # .I --- 04:136513 --:------ 01:158182 3150 002 01CA < often seen CA, artefact?
 
-    def complex_idx(seqx, msg) -> dict:
+    # the idx_name is the same for every element, so determine it only once
+    idx_name = "ufx_idx" if msg.src.type == DEV_TYPE_MAP.UFC else SZ_ZONE_IDX  # DEX
+
+    def complex_idx(seqx) -> dict:
         # assert seqx[:2] == FC or (int(seqx[:2], 16) < MAX_ZONES)  # <5, 8 for UFC
-        idx_name = "ufx_idx" if msg.src.type == DEV_TYPE_MAP.UFC else SZ_ZONE_IDX  # DEX
         return {SZ_DOMAIN_ID if seqx[:1] == "F" else idx_name: seqx[:2]}
 
     if msg._has_array:
         return [
             {
-                **complex_idx(payload[i : i + 2], msg),
+                **complex_idx(payload[i : i + 2]),
                 **parser_valve_demand(payload[i + 2 : i + 4]),
             }
             for i in range(0, len(payload), 4)
@@ -2270,6 +2292,9 @@ def parser_3220(payload, msg) -> dict:
     except ValueError as exc:
         raise InvalidPayloadError(f"OpenTherm: {exc}") from exc
 
+    # decode_frame() is cached, so don't share its result (incl. any flag8 lists)
+    ot_value = {k: v.copy() if isinstance(v, list) else v for k, v in ot_value.items()}
+
     # NOTE: Unknown-DataId isn't an invalid payload & is useful to train the OTB device
     if ot_schema is None and ot_type != OtMsgType.UNKNOWN_DATAID:
         raise InvalidPayloadError(f"OpenTherm: Unknown data-id: {ot_id}")
@@ -2332,11 +2357,12 @@ def parser_3221(payload, msg) -> dict:
     # RP --- 10:048122 18:006402 --:------ 3221 002 0000
     # RP --- 32:155617 18:005904 --:------ 3221 002 000A
 
-    assert int(payload[2:], 16) <= 0xC8, _INFORM_DEV_MSG
+    value = int(payload[2:], 16)
+    assert value <= 0xC8, _INFORM_DEV_MSG
 
     return {
         f"_{SZ_PAYLOAD}": payload,
-        SZ_VALUE: int(payload[2:], 16),
+        SZ_VALUE: value,
     }
 
 
@@ -2364,11 +2390,12 @@ def parser_3222(payload, msg) -> dict:
 
 @parser_decorator  # unknown_3223, from OTB
 def parser_3223(payload, msg) -> dict:
-    assert int(payload[2:], 16) <= 0xC8, _INFORM_DEV_MSG
+    value = int(payload[2:], 16)
+    assert value <= 0xC8, _INFORM_DEV_MSG
 
     return {
         f"_{SZ_PAYLOAD}": payload,
-        SZ_VALUE: int(payload[2:], 16),
+        SZ_VALUE: value,
     }
 
 
@@ -2396,9 +2423,7 @@ def parser_3b00(payload, msg) -> dict:
 
     def complex_idx(payload, msg) -> dict:  # has complex idx
         if (
-            msg.verb == I_
-            and msg.src.type in (DEV_TYPE_MAP.CTL, DEV_TYPE_MAP.PRG)
-            and msg.src is msg.dst
+            msg.verb == I_ and msg.src.type in _3B00_CTL_TYPES and msg.src is msg.dst
         ):  # DEX
             assert payload[:2] == FC
             return {SZ_DOMAIN_ID: FC}
@@ -2406,19 +2431,12 @@ def parser_3b00(payload, msg) -> dict:
         return {}
 
     assert msg.len == 2, msg.len
-    assert payload[:2] == {
-        DEV_TYPE_MAP.CTL: FC,
-        DEV_TYPE_MAP.BDR: "00",
-        DEV_TYPE_MAP.PRG: FC,
-    }.get(
-        msg.src.type, "00"
-    )  # DEX
+    assert payload[:2] == _3B00_DOMAIN_ID.get(msg.src.type, "00")  # DEX
     assert payload[2:] == "C8", payload[2:]  # Could it be a percentage?
 
-    return {
-        **complex_idx(payload[:2], msg),
-        "actuator_sync": hex_to_bool(payload[2:]),
-    }
+    result = complex_idx(payload[:2], msg)  # a new dict, so can be updated in place
+    result["actuator_sync"] = hex_to_bool(payload[2:])
+    return result
 
 
 @parser_decorator  # actuator_state
@@ -2459,29 +2477,34 @@ def parser_3ef0(payload, msg) -> dict:
 
         # for OTB (there's no reliable) modulation_level <-> flame_state)
 
+        flags_3 = int(payload[6:8], 0x10)
+
         result.update(
             {
                 "_flags_3": hex_to_flag8(payload[6:8]),
-                "ch_active": bool(int(payload[6:8], 0x10) & 1 << 1),
-                "dhw_active": bool(int(payload[6:8], 0x10) & 1 << 2),
-                "cool_active": bool(int(payload[6:8], 0x10) & 1 << 4),
-                "flame_on": bool(int(payload[6:8], 0x10) & 1 << 3),  # flame_on
+                "ch_active": bool(flags_3 & 1 << 1),
+                "dhw_active": bool(flags_3 & 1 << 2),
+                "cool_active": bool(flags_3 & 1 << 4),
+                "flame_on": bool(flags_3 & 1 << 3),  # flame_on
                 "_unknown_4": payload[8:10],  # FF, 00, 01, 0A
                 "_unknown_5": payload[10:12],  # FF, 1C, ?others
             }
         )
 
     if msg.len >= 9:  # I/RP|OTB|009 (R8820A only?)
-        assert int(payload[12:14], 16) & 0b11111100 == 0, f"byte 6: {payload[12:14]}"
-        assert int(payload[12:14], 16) & 0b00000010 == 2, f"byte 6: {payload[12:14]}"
-        assert 10 <= int(payload[14:16], 16) <= 90, f"byte 7: {payload[14:16]}"
+        flags_6 = int(payload[12:14], 0x10)
+        ch_setpoint = int(payload[14:16], 0x10)
+
+        assert flags_6 & 0b11111100 == 0, f"byte 6: {payload[12:14]}"
+        assert flags_6 & 0b00000010 == 2, f"byte 6: {payload[12:14]}"
+        assert 10 <= ch_setpoint <= 90, f"byte 7: {payload[14:16]}"
         assert int(payload[16:18], 16) in (0, 100), f"byte 8: {payload[18:]}"
 
         result.update(
             {
                 "_flags_6": hex_to_flag8(payload[12:14]),
-                "ch_enabled": bool(int(payload[12:14], 0x10) & 1 << 0),
-                "ch_setpoint": int(payload[14:16], 0x10),
+                "ch_enabled": bool(flags_6 & 1 << 0),
+                "ch_setpoint": ch_setpoint,
                 "max_rel_modulation": hex_to_percent(payload[16:18], high_res=False),
             }
         )
@@ -2624,7 +2647,7 @@ def parser_4e01(payload, msg) -> dict:
     # .I --- 02:248945 02:250708 --:------ 4E01 018 00-7FFF7FFF7FFF09077FFF7FFF7FFF7FFF-00  # 23.11, 8-group
     # .I --- 02:250984 02:250704 --:------ 4E01 018 00-7FFF7FFF7FFF7FFF08387FFF7FFF7FFF-00  # 21.04
 
-    num_groups = int((msg.len - 2) / 2)  # e.g. (18 - 2) / 2
+    num_groups = (msg.len - 2) // 2  # e.g. (18 - 2) / 2
     assert (
         num_groups * 2 == msg.len - 2
     ), _INFORM_DEV_MSG  # num_groups: len 018 (8-group, 2+8*4), or 026 (12-group, 2+12*4)
@@ -2644,7 +2667,7 @@ def parser_4e02(payload, msg) -> dict:  # sent a triplets, 1 min apart
     # .I --- 02:248945 02:250708 --:------ 4E02 034 00-7FFF7FFF7FFF07D07FFF7FFF7FFF7FFF-02-7FFF7FFF7FFF08347FFF7FFF7FFF7FFF  # 20.00-21.00
     # .I --- 02:250984 02:250704 --:------ 4E02 034 00-7FFF7FFF7FFF076C7FFF7FFF7FFF7FFF-02-7FFF7FFF7FFF07D07FFF7FFF7FFF7FFF  #
 
-    num_groups = int((msg.len - 2) / 4)  # e.g. (34 - 2) / 4
+    num_groups = (msg.len - 2) // 4  # e.g. (34 - 2) / 4
     assert (
         num_groups * 4 == msg.len - 2
     ), _INFORM_DEV_MSG  # num_groups: len 034 (8-group, 2+8*4), or 050 (12-group, 2+12*4)
@@ -184,7 +184,8 @@ class MessageTransport(asyncio.Transport):
                 self.get_write_buffer_size()
 
             _LOGGER.error("MsgTransport.pkt_dispatcher(): connection_lost(None)")
-            [p.connection_lost(None) for p in self._protocols]
+            for p in self._protocols:
+                p.connection_lost(None)
 
         self._dispatcher = dispatcher  # type: ignore[assignment]
         self._extra[self.WRITER] = self._loop.create_task(pkt_dispatcher())
@@ -294,7 +295,8 @@ class MessageTransport(asyncio.Transport):
         if task := self._extra.get(self.WRITER):
             task.cancel()
 
-        [self._loop.call_soon(p.connection_lost, None) for p in self._protocols]
+        for p in self._protocols:
+            self._loop.call_soon(p.connection_lost, None)
 
     def is_closing(self) -> bool:
         """Return True if the transport is closing or closed."""
@@ -113,6 +113,8 @@ Pause = SimpleNamespace(
 )
 
 VALID_CHARACTERS = printable  # "".join((ascii_letters, digits, ":-<*# "))
+# non-ASCII bytes are not deleted, so that they will still raise UnicodeDecodeError
+_INVALID_BYTES = bytes(b for b in range(128) if chr(b) not in VALID_CHARACTERS)
 
 # evofw3 commands (as of 0.7.0) include (from cmd.c):
 # case 'V':  validCmd = cmd_version( cmd );       break;
@@ -128,11 +130,7 @@ VALID_CHARACTERS = printable  # "".join((ascii_letters, digits, ":-<*# "))
 
 def _str(value: bytes) -> str:
     try:
-        result = "".join(
-            c
-            for c in value.decode("ascii", errors="strict")  # was: .strip()
-            if c in VALID_CHARACTERS
-        )
+        result = value.translate(None, _INVALID_BYTES).decode("ascii", errors="strict")
     except UnicodeDecodeError:
         _LOGGER.warning("%s < Cant decode bytestream (ignoring)", value)
         return ""
@@ -245,12 +243,10 @@ def track_system_syncs(fnc: Callable):
             return fnc(self, pkt, *args, **kwargs)
 
         sync_cycles = deque(
-            p for p in sync_cycles if p.src != pkt.src and is_pending(p)
+            (p for p in sync_cycles if p.src != pkt.src and is_pending(p)),
+            maxlen=MAX_SYNCS_TRACKED,  # safety net for corrupted payloads
         )
-        sync_cycles.append(pkt)  # TODO: sort
-
-        if len(sync_cycles) > MAX_SYNCS_TRACKED:  # safety net for corrupted payloads
-            sync_cycles.popleft()
+        sync_cycles.append(pkt)  # TODO: sort, NB: will evict the oldest, if full
 
         fnc(self, pkt, *args, **kwargs)
 
@@ -523,7 +519,7 @@ class PacketProtocolBase(asyncio.Protocol):
 
         self._transport: asyncio.Transport = None  # type: ignore[assignment]
         self._pause_writing = True
-        self._recv_buffer = bytes()
+        self._recv_buffer = bytearray()  # is extended/consumed in place
 
         self._prev_pkt: Packet = None  # type: ignore[assignment]
         self._this_pkt: Packet = None  # type: ignore[assignment]
@@ -532,9 +528,10 @@ class PacketProtocolBase(asyncio.Protocol):
         self._evofw_flag = getattr(gwy.config, "evofw_flag", None)
 
         self.enforce_include = gwy.config.enforce_known_list
-        self._exclude = list(gwy._exclude.keys())
-        self._include = list(gwy._include.keys()) + [NON_DEV_ADDR.id, NUL_DEV_ADDR.id]
-        self._unwanted: list = []  # not: [NON_DEV_ADDR.id, NUL_DEV_ADDR.id]
+        # these are sets, as they are tested for membership with every packet
+        self._exclude = set(gwy._exclude)
+        self._include = set(gwy._include) | {NON_DEV_ADDR.id, NUL_DEV_ADDR.id}
+        self._unwanted: set = set()  # not: {NON_DEV_ADDR.id, NUL_DEV_ADDR.id}
 
         self._hgi80: dict[str, Any] = {
             SZ_DEVICE_ID: None,
@@ -571,11 +568,13 @@ class PacketProtocolBase(asyncio.Protocol):
 
         if self.enforce_include:  # TODO: here, or in init?
             _LOGGER.info(
-                f"Enforcing the {SZ_KNOWN_LIST} (as a whitelist): %s", self._include
+                f"Enforcing the {SZ_KNOWN_LIST} (as a whitelist): %s",
+                sorted(self._include),
             )
         elif self._exclude:
             _LOGGER.info(
-                f"Enforcing the {SZ_BLOCK_LIST} (as a blacklist): %s", self._exclude
+                f"Enforcing the {SZ_BLOCK_LIST} (as a blacklist): %s",
+                sorted(self._exclude),
             )
         else:
             _LOGGER.warning(
@@ -611,10 +610,11 @@ class PacketProtocolBase(asyncio.Protocol):
 
         def bytes_received(data: bytes) -> Iterable[tuple[dt, bytes]]:
             self._recv_buffer += data
-            if b"\r\n" in self._recv_buffer:
-                lines = self._recv_buffer.split(b"\r\n")
-                self._recv_buffer = lines[-1]
-                for line in lines[:-1]:
+            if (end := self._recv_buffer.rfind(b"\r\n")) != -1:
+                with memoryview(self._recv_buffer) as view:  # copy only once
+                    lines = bytes(view[:end]).split(b"\r\n")
+                del self._recv_buffer[: end + 2]  # keep any partial line
+                for line in lines:
                     yield self._dt_now(), line
 
         for dtm, raw_line in bytes_received(data):
@@ -661,7 +661,7 @@ class PacketProtocolBase(asyncio.Protocol):
                 if dev_id[:2] != DEV_TYPE_MAP.HGI:
                     continue
                 if dev_id not in self._include and self._hgi80[SZ_DEVICE_ID]:
-                    self._unwanted.append(dev_id)
+                    self._unwanted.add(dev_id)
                     raise ForeignGatewayError(
                         f"Blacklisting a Foreign gateway (or is it HVAC?): {dev_id}"
                         f" (Active gateway: {self._hgi80[SZ_DEVICE_ID]}){TIP}"
@@ -695,12 +695,17 @@ class PacketProtocolFile(PacketProtocolBase):
         super().__init__(gwy, pkt_handler)
 
         self._dt_str_: str = None  # type: ignore[assignment]
+        self._dtm_: dt = None  # type: ignore[assignment]  # parsed from _dt_str_
 
     def _dt_now(self) -> dt:
         """Return a precise datetime, using a packet's dtm field."""
 
+        if self._dtm_ is not None:  # is called many times per pkt, so parse only once
+            return self._dtm_
+
         try:
-            return dt.fromisoformat(self._dt_str_)  # always current pkt's dtm
+            self._dtm_ = dt.fromisoformat(self._dt_str_)  # always current pkt's dtm
+            return self._dtm_
         except (TypeError, ValueError):
             pass
 
@@ -713,8 +718,9 @@ class PacketProtocolFile(PacketProtocolBase):
         """Called when a packet line is received (from a log file)."""
 
         self._dt_str_ = data[:26]  # used for self._dt_now
+        self._dtm_ = None  # type: ignore[assignment]
 
-        self._line_received(data[:26], data[27:].strip(), data)
+        self._line_received(self._dt_str_, data[27:].strip(), data)
 
     def _line_received(self, dtm: str, line: str, raw_line: str) -> None:  # type: ignore[override]
         try:
@@ -819,12 +825,10 @@ class PacketProtocolPort(PacketProtocolBase):
         while self._pause_writing:
             await asyncio.sleep(0.005)
 
-        data_bytes = bytes(
-            _regex_hack(
-                data,
-                self._use_regex.get(SZ_OUTBOUND, {}),
-            ).encode("ascii")
-        )
+        data_bytes = _regex_hack(  # str.encode() already returns bytes
+            data,
+            self._use_regex.get(SZ_OUTBOUND, {}),
+        ).encode("ascii")
 
         await self._sem.acquire()  # minimum time between Tx
 
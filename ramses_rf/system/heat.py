@@ -145,7 +145,8 @@ class SystemBase(Parent, Entity):  # 3B00 (multi-relay)
             self.get_dhw_zone(**_schema)  # self._dhw = ...
 
         if _schema := (schema.get(SZ_ZONES)):
-            [self.get_htg_zone(idx, **s) for idx, s in _schema.items()]
+            for idx, s in _schema.items():
+                self.get_htg_zone(idx, **s)
 
     @classmethod
     def create_from_schema(cls, ctl: Device, **schema):
@@ -486,19 +487,15 @@ class MultiZone(SystemBase):  # 0005 (+/- 000C?)
         # TODO: a I/0005 may have changed: del or add zones
         if msg.code == Code._0005:
             if (zone_type := msg.payload[SZ_ZONE_TYPE]) in ZON_ROLE_MAP.HEAT_ZONES:
-                [
-                    self.get_htg_zone(
-                        f"{idx:02X}", **{SZ_CLASS: ZON_ROLE_MAP[zone_type]}
-                    )
-                    for idx, flag in enumerate(msg.payload[SZ_ZONE_MASK])
-                    if flag == 1
-                ]
+                for idx, flag in enumerate(msg.payload[SZ_ZONE_MASK]):
+                    if flag == 1:
+                        self.get_htg_zone(
+                            f"{idx:02X}", **{SZ_CLASS: ZON_ROLE_MAP[zone_type]}
+                        )
             elif zone_type in DEV_ROLE_MAP.HEAT_DEVICES:
-                [
-                    self.get_htg_zone(f"{idx:02X}", msg=msg)
-                    for idx, flag in enumerate(msg.payload[SZ_ZONE_MASK])
-                    if flag == 1
-                ]
+                for idx, flag in enumerate(msg.payload[SZ_ZONE_MASK]):
+                    if flag == 1:
+                        self.get_htg_zone(f"{idx:02X}", msg=msg)
             return
 
         # TODO: a I/000C may have changed: del or add devices
@@ -513,8 +510,9 @@ class MultiZone(SystemBase):  # 0005 (+/- 000C?)
 
         # the CTL knows, but does not announce temps for multiroom_mode zones
         if msg.code == Code._30C9 and msg._has_array:
+            zone_idxs = {x[SZ_ZONE_IDX] for x in msg.payload}  # not once per zone
             for z in self.zones:
-                if z.idx not in (x[SZ_ZONE_IDX] for x in msg.payload):
+                if z.idx not in zone_idxs:
                     z._get_temp()
 
         # If some zones still don't have a sensor, maybe eavesdrop?
@@ -532,7 +530,8 @@ class MultiZone(SystemBase):  # 0005 (+/- 000C?)
         elif isinstance(msg.payload, list) and len(msg.payload):
             # TODO: elif msg.payload.get(SZ_DOMAIN_ID) == FA:  # DHW
             if isinstance(msg.payload[0], dict):  # e.g. 1FC9 is a list of lists:
-                [handle_msg_by_zone_idx(z.get(SZ_ZONE_IDX), msg) for z in msg.payload]
+                for z in msg.payload:
+                    handle_msg_by_zone_idx(z.get(SZ_ZONE_IDX), msg)
 
         # If some zones still don't have a sensor, maybe eavesdrop?
         if (  # TODO: edge case: 1 zone with CTL as SEN
@@ -368,7 +368,7 @@ def fragments_to_schedule(fragments: Iterable) -> dict:
     May raise a `zlib.error` exception.
     """
 
-    raw_schedule = zlib.decompress(bytearray.fromhex("".join(fragments)))
+    raw_schedule = zlib.decompress(bytes.fromhex("".join(fragments)))
 
     old_day = 0
     schedule = []
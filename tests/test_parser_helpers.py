@@ -45,7 +45,7 @@ def test_pkt_addr_parser(gwy):  # noqa: F811
         assert (pkt.src.id, pkt.dst.id) == eval(pkt_dict)
 
     with open(f"{WORK_DIR}/pkt_addrs.log") as f:
-        while line := (f.readline()):
+        for line in f:
             if line.strip():
                 proc_log_line(gwy, line)
 
@@ -8,7 +8,6 @@
 """
 
 import asyncio
-from inspect import isclass
 from typing import TypeVar
 from unittest.mock import patch
 
@@ -25,7 +24,6 @@ _Faked = TypeVar("_Faked", bound=Fakeable)
 CONFIRM_TIMEOUT_SECS = 0.001  # to patch ramses_rf.bind_state
 WAITING_TIMEOUT_SECS = 0  # to patch ramses_rf.bind_state
 
-ASSERT_CYCLE_TIME = 0.001  # max_cycles_per_assert = max_sleep / ASSERT_CYCLE_TIME
 DEFAULT_MAX_SLEEP = 1
 
 
@@ -37,9 +35,13 @@ TEST_DATA = (
 async def assert_context_state(
     ctx: Context, expected_state: type[_State], max_sleep: int = 0
 ):
-    for _ in range(int(max_sleep / ASSERT_CYCLE_TIME)):
-        await asyncio.sleep(ASSERT_CYCLE_TIME)
-        if ctx._state.__class__ is expected_state:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_sleep
+
+    while ctx._state.__class__ is not expected_state:
+        try:  # is woken by each change of state, rather than polling
+            await asyncio.wait_for(ctx._state_changed.wait(), deadline - loop.time())
+        except asyncio.TimeoutError:
             break
     assert ctx._state.__class__ is expected_state
 
@@ -260,9 +262,7 @@ async def test_binding_init_1(supplicant: _Faked, respondent: _Faked, _):
     assert supplicant._context is None
 
     # BAD: Create a Context with an initial State other than Listening, Offering
-    for state in [s for s in BindState.__dict__.values() if isclass(s)]:
-        if state in (BindState.LISTENING, BindState.OFFERING):
-            continue
+    for state in BindState._ALL_STATES - {BindState.LISTENING, BindState.OFFERING}:
         try:
             supplicant._context = Context(supplicant, state)
         except Exceptions.BindStateError: